@@ -61,6 +61,10 @@ uv sync
 echo "📦 Installing ytdownloader..."
 uv pip install -e .
 
+# Precompile bytecode so the first run doesn't pay for it
+echo "📦 Precompiling bytecode..."
+python -m compileall -q -j 0 ytdownloader/
+
 # Test installation
 echo "🔍 Testing installation..."
 if ytdownloader --version > /dev/null 2>&1; then
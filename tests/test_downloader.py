@@ -0,0 +1,271 @@
+"""
+Tests for reusing extracted video info in YouTubeDownloader.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+import yt_dlp
+
+from ytdownloader import downloader as downloader_module
+from ytdownloader.downloader import YouTubeDownloader, validate_youtube_url
+
+URL = 'https://www.youtube.com/watch?v=abc123'
+
+
+def fake_info():
+    """Info for a video with a separate 1080p video and an audio format."""
+    return {
+        'id': 'abc123',
+        'title': 'Test video',
+        'extractor': 'youtube',
+        'extractor_key': 'Youtube',
+        'webpage_url': URL,
+        'formats': [
+            {
+                'format_id': '137', 'url': 'https://x/137', 'ext': 'mp4', 'protocol': 'https',
+                'vcodec': 'avc1.640028', 'acodec': 'none', 'height': 1080,
+            },
+            {
+                'format_id': '251', 'url': 'https://x/251', 'ext': 'webm', 'protocol': 'https',
+                'vcodec': 'none', 'acodec': 'opus', 'abr': 160,
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def downloaded(monkeypatch, tmp_path):
+    """Stub out extraction and downloads, recording the formats each download fetches."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    
+    def extract_info(self, url, download=True, **kwargs):
+        # Same as a real extraction: the default selection is run on the result
+        return self.process_ie_result(fake_info(), download=False)
+    
+    fetched = []
+    
+    def process_info(self, info_dict):
+        formats = info_dict.get('requested_formats') or [info_dict]
+        fetched.append([fmt['format_id'] for fmt in formats])
+    
+    monkeypatch.setattr(yt_dlp.YoutubeDL, 'extract_info', extract_info)
+    monkeypatch.setattr(yt_dlp.YoutubeDL, 'process_info', process_info)
+    return fetched
+
+
+@pytest.mark.parametrize('use_cache', [True, False])
+def test_audio_download_of_reused_info_fetches_only_audio(downloaded, tmp_path, use_cache):
+    downloader = YouTubeDownloader(output_dir=str(tmp_path), use_cache=use_cache)
+    info = downloader.get_video_info(URL)
+    
+    # No file is written by the stub, so no path gets captured
+    with pytest.raises(RuntimeError, match="file path not captured"):
+        downloader.download_audio_only(URL, info=info, audio_format='opus')
+    
+    assert downloaded == [['251']]
+
+
+def test_cached_info_is_reselected(downloaded, tmp_path):
+    downloader = YouTubeDownloader(output_dir=str(tmp_path), quality='audio')
+    downloader.get_video_info(URL)
+    
+    # Served from the on-disk cache this time
+    info = downloader.get_video_info(URL)
+    with pytest.raises(RuntimeError, match="file path not captured"):
+        downloader.download(URL, info=info)
+    
+    assert downloaded == [['251']]
+
+
+
+def test_only_the_cached_copy_is_sanitized(downloaded, tmp_path):
+    downloader = YouTubeDownloader(output_dir=str(tmp_path))
+    
+    fetched = downloader.get_video_info(URL)
+    cached = downloader.get_video_info(URL)
+    
+    assert 'requested_formats' in fetched
+    assert 'requested_formats' not in cached
+    assert {fmt['format_id'] for fmt in cached['formats']} == {'137', '251'}
+
+
+def test_download_does_not_keep_earlier_progress_bars(downloaded, tmp_path):
+    downloader = YouTubeDownloader(output_dir=str(tmp_path), use_cache=False)
+    downloader._update_progress({'filename': 'earlier.mp4', 'downloaded_bytes': 1}, "📥 Downloading")
+    
+    with pytest.raises(RuntimeError, match="file path not captured"):
+        downloader.download(URL)
+    
+    assert downloader.progress.tasks == []
+
+def test_parallel_download_of_reused_info_uses_new_selection(downloaded, tmp_path, monkeypatch):
+    downloader = YouTubeDownloader(output_dir=str(tmp_path), quality='audio')
+    info = YouTubeDownloader(output_dir=str(tmp_path), use_cache=False).get_video_info(URL)
+    
+    ranged = []
+    
+    def download_ranged(ydl, info, connections, progress_hook):
+        ranged.append([fmt['format_id'] for fmt in info.get('requested_formats') or [info]])
+        return None  # Let yt-dlp download it instead
+    
+    monkeypatch.setattr(downloader, '_download_ranged', download_ranged)
+    with pytest.raises(RuntimeError, match="file path not captured"):
+        downloader.download(URL, connections=4, info=info)
+    
+    assert ranged == [['251']]
+    assert downloaded == [['251']]
+
+
+class FakeYDL:
+    """Just enough of YoutubeDL for _download_ranged with a single format."""
+    
+    def __init__(self, filename):
+        self.filename = filename
+    
+    def prepare_filename(self, info):
+        return self.filename
+
+
+def ranged_info(size):
+    return {
+        'format_id': '18', 'ext': 'mp4', 'protocol': 'https',
+        'url': 'https://x/18', 'filesize': size,
+    }
+
+
+def write_ranges(url, headers, fd, start, end, retries=3):
+    os.pwrite(fd, b'x' * (end - start + 1), start)
+    return end - start + 1
+
+
+def test_ranged_download_moves_part_into_place(tmp_path, monkeypatch):
+    final_file = tmp_path / 'video.mp4'
+    # A larger leftover from an earlier attempt must not leak into the result
+    (tmp_path / 'video.mp4.part').write_bytes(b'y' * 2048)
+    monkeypatch.setattr(downloader_module, '_fetch_range', write_ranges)
+    
+    downloader = YouTubeDownloader(output_dir=str(tmp_path), use_cache=False)
+    result = downloader._download_ranged(FakeYDL(str(final_file)), ranged_info(1000), 4, lambda d: None)
+    
+    assert result == str(final_file)
+    assert final_file.read_bytes() == b'x' * 1000
+    assert not (tmp_path / 'video.mp4.part').exists()
+
+
+def test_interrupted_ranged_download_leaves_no_file(tmp_path, monkeypatch):
+    final_file = tmp_path / 'video.mp4'
+    
+    def interrupt(url, headers, fd, start, end, retries=3):
+        raise KeyboardInterrupt
+    
+    monkeypatch.setattr(downloader_module, '_fetch_range', interrupt)
+    
+    downloader = YouTubeDownloader(output_dir=str(tmp_path), use_cache=False)
+    with pytest.raises(KeyboardInterrupt):
+        downloader._download_ranged(FakeYDL(str(final_file)), ranged_info(1000), 4, lambda d: None)
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_ranged_download_falls_back_to_yt_dlp(downloaded, tmp_path, monkeypatch):
+    downloader = YouTubeDownloader(output_dir=str(tmp_path), use_cache=False)
+    info = downloader.get_video_info(URL)
+    
+    def forbidden(ydl, info, connections, progress_hook):
+        raise RuntimeError("HTTP Error 403: Forbidden")
+    
+    monkeypatch.setattr(downloader, '_download_ranged', forbidden)
+    with pytest.raises(RuntimeError, match="file path not captured"):
+        downloader.download(URL, connections=4, info=info)
+    
+    assert downloaded == [['137', '251']]
+
+
+
+def test_concurrent_extraction_gives_each_thread_its_own_session(downloaded, monkeypatch):
+    extract_info = yt_dlp.YoutubeDL.extract_info
+    threads_by_session = {}
+    
+    def recording_extract_info(self, url, download=True, **kwargs):
+        threads_by_session.setdefault(id(self), set()).add(threading.get_ident())
+        time.sleep(0.01)  # Keep workers busy so the pool spreads the URLs out
+        return extract_info(self, url, download=download, **kwargs)
+    
+    monkeypatch.setattr(yt_dlp.YoutubeDL, 'extract_info', recording_extract_info)
+    
+    urls = [f'https://www.youtube.com/watch?v=video{i}' for i in range(8)]
+    infos = YouTubeDownloader(use_cache=False).get_video_info_many(urls)
+    
+    assert len(infos) == len(urls)
+    assert len(threads_by_session) > 1
+    assert all(len(threads) == 1 for threads in threads_by_session.values())
+
+class ShortResponse:
+    """A 206 response whose body stops early."""
+    
+    status = 206
+    
+    def __init__(self):
+        self.chunks = [b'x' * 10]
+    
+    def read(self, size):
+        return self.chunks.pop() if self.chunks else b''
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+def test_fetch_range_never_reports_a_short_read_as_success(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader_module.urllib.request, 'urlopen', lambda request, timeout: ShortResponse())
+    fd = os.open(tmp_path / 'part', os.O_RDWR | os.O_CREAT)
+    try:
+        with pytest.raises(RuntimeError, match="Short read"):
+            downloader_module._fetch_range('https://x/18', {}, fd, 0, 99)
+        with pytest.raises(RuntimeError, match="no attempts"):
+            downloader_module._fetch_range('https://x/18', {}, fd, 0, 99, retries=0)
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.parametrize('limit', [None, 20, 1])
+def test_list_formats_is_best_first_whatever_the_limit(limit):
+    info = fake_info()
+    info['formats'].reverse()  # Worst first, as yt-dlp orders them
+    
+    formats = YouTubeDownloader(use_cache=False).list_formats(info, limit=limit)
+    
+    assert [fmt['format_id'] for fmt in formats] == ['137', '251'][:limit]
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.youtube.com/watch?v=abc123',
+    'https://youtube.com/watch?v=abc123',
+    'http://m.youtube.com/watch?v=abc123',
+    'https://music.youtube.com/watch?v=abc123',
+    'https://www.youtube.com/shorts/abc123',
+    'https://youtu.be/abc123',
+    'https://youtu.be/abc123?t=42',
+    'HTTPS://WWW.YOUTUBE.COM/watch?v=abc123',
+])
+def test_validate_youtube_url_accepts_youtube_hosts(url):
+    assert validate_youtube_url(url)
+
+
+@pytest.mark.parametrize('url', [
+    'https://youtube.com.evil.com/watch?v=abc123',
+    'https://evilyoutube.com/watch?v=abc123',
+    'https://youtu.be.evil.com/abc123',
+    'https://www.youtube.community/watch?v=abc123',
+    'ftp://youtube.com/watch?v=abc123',
+    'youtube.com/watch?v=abc123',
+    '',
+    None,
+])
+def test_validate_youtube_url_rejects_other_hosts(url):
+    assert not validate_youtube_url(url)
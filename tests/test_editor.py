@@ -0,0 +1,172 @@
+"""
+Tests for the ffmpeg command lines VideoEditor builds and time parsing.
+"""
+
+import shutil
+
+import ffmpeg
+import pytest
+
+from ytdownloader import editor
+from ytdownloader.editor import VideoEditor, parse_time
+
+
+@pytest.fixture
+def commands(monkeypatch):
+    """Capture each ffmpeg command line instead of running it."""
+    captured = []
+    monkeypatch.setattr(shutil, 'which', lambda name: f'/usr/bin/{name}')
+    monkeypatch.setattr(editor, '_select_h264_encoder', lambda: 'libx264')
+    monkeypatch.setattr(ffmpeg, 'run', lambda stream, **kwargs: captured.append(ffmpeg.compile(stream)))
+    return captured
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / 'in.mp4'
+    path.touch()
+    return str(path)
+
+
+@pytest.mark.parametrize('video_codec', ['libx265', 'libvpx-vp9', 'libx264'])
+def test_crf_kept_for_software_encoders(commands, input_file, tmp_path, video_codec):
+    VideoEditor().convert_format(
+        input_file, str(tmp_path / 'out.mkv'), video_codec=video_codec, crf=28, force_reencode=True
+    )
+    
+    args = commands[-1]
+    assert args[args.index('-crf') + 1] == '28'
+
+
+def test_crf_mapped_for_nvenc(commands, input_file, tmp_path):
+    VideoEditor().convert_format(
+        input_file, str(tmp_path / 'out.mkv'), video_codec='libx264', crf=28,
+        force_reencode=True, hw='h264_nvenc'
+    )
+    
+    args = commands[-1]
+    assert args[args.index('-cq') + 1] == '28'
+    assert '-crf' not in args
+
+
+
+def test_vaapi_conversion_maps_audio_optionally(commands, input_file, tmp_path):
+    VideoEditor().convert_format(
+        input_file, str(tmp_path / 'out.mkv'), video_codec='libx264', force_reencode=True,
+        hw='h264_vaapi'
+    )
+    
+    args = commands[-1]
+    assert '0:a?' in args
+    assert '0:a' not in args
+
+@pytest.fixture
+def h264_aac_file(monkeypatch, input_file):
+    """An input whose probe reports H.264 video and AAC audio."""
+    info = {'duration': 60.0, 'video_codec': 'h264', 'audio_codec': 'aac'}
+    monkeypatch.setattr(VideoEditor, 'get_video_info', lambda self, path, stat=None: dict(info))
+    return input_file
+
+
+def test_pipeline_copies_streams_already_in_target_codecs(commands, h264_aac_file, tmp_path):
+    VideoEditor().pipeline(
+        h264_aac_file, str(tmp_path / 'out.mkv'), video_codec='libx264', audio_codec='aac'
+    )
+    
+    args = commands[-1]
+    assert args[args.index('-vcodec') + 1] == 'copy'
+    assert args[args.index('-acodec') + 1] == 'copy'
+
+
+
+def test_pipeline_probes_with_its_own_stat(commands, input_file, tmp_path, monkeypatch):
+    probed = []
+    
+    def get_video_info(self, path, stat=None):
+        probed.append(stat)
+        return {'duration': 60.0, 'video_codec': 'h264', 'audio_codec': 'aac'}
+    
+    monkeypatch.setattr(VideoEditor, 'get_video_info', get_video_info)
+    VideoEditor().pipeline(
+        input_file, str(tmp_path / 'out.mkv'), video_codec='libx264', audio_codec='aac'
+    )
+    
+    assert probed and None not in probed
+
+def test_pipeline_force_reencode(commands, h264_aac_file, tmp_path):
+    VideoEditor().pipeline(
+        h264_aac_file, str(tmp_path / 'out.mkv'), video_codec='libx264', audio_codec='aac',
+        force_reencode=True
+    )
+    
+    args = commands[-1]
+    assert args[args.index('-vcodec') + 1] == 'libx264'
+    assert args[args.index('-acodec') + 1] == 'aac'
+
+
+def test_pipeline_reencodes_resized_video(commands, h264_aac_file, tmp_path):
+    VideoEditor().pipeline(
+        h264_aac_file, str(tmp_path / 'out.mkv'), scale='720', video_codec='libx264', audio_codec='aac'
+    )
+    
+    args = commands[-1]
+    assert args[args.index('-vcodec') + 1] == 'libx264'
+    assert args[args.index('-acodec') + 1] == 'copy'
+
+
+@pytest.fixture
+def silent_file(monkeypatch, input_file):
+    """An input whose probe reports H.264 video and no audio stream."""
+    info = {'duration': 60.0, 'video_codec': 'h264'}
+    monkeypatch.setattr(VideoEditor, 'get_video_info', lambda self, path, stat=None: dict(info))
+    return input_file
+
+
+@pytest.mark.parametrize('trim', [None, (10.0, 20.0)])
+def test_pipeline_maps_audio_optionally(commands, silent_file, tmp_path, trim):
+    VideoEditor().pipeline(
+        silent_file, str(tmp_path / 'out.mkv'), trim=trim, scale='720', audio_codec='aac'
+    )
+    
+    args = commands[-1]
+    assert '0:a?' in args
+    assert 'atrim' not in ' '.join(args)
+
+
+
+@pytest.mark.parametrize('trim, summary', [
+    ((10, 20), 'Trim: 10s - 20s'),
+    ((10, None), 'Trim: 10s - end'),
+    ((None, 20), 'Trim: 0s - 20s'),
+])
+def test_pipeline_trim_summary(commands, h264_aac_file, tmp_path, capsys, trim, summary):
+    VideoEditor().pipeline(h264_aac_file, str(tmp_path / 'out.mkv'), trim=trim)
+    
+    assert summary in capsys.readouterr().out
+
+def test_pipeline_skips_extraction_without_audio(commands, silent_file, tmp_path):
+    VideoEditor().pipeline(
+        silent_file, str(tmp_path / 'out.mkv'), scale='720', extract_audio_to=str(tmp_path / 'a.mp3')
+    )
+    
+    assert not any(arg.endswith('a.mp3') for arg in commands[-1])
+    
+    with pytest.raises(ValueError, match="No audio stream"):
+        VideoEditor().pipeline(silent_file, None, extract_audio_to=str(tmp_path / 'a.mp3'))
+
+
+@pytest.mark.parametrize('time_str, seconds', [
+    ('30', 30.0),
+    ('2.5', 2.5),
+    ('1:30', 90.0),
+    ('1:02:03.5', 3723.5),
+    ('0:00:00', 0.0),
+])
+def test_parse_time(time_str, seconds):
+    assert parse_time(time_str) == seconds
+
+
+@pytest.mark.parametrize('time_str', ['1:2:3:4', '', '1:', 'a:30', '1::30'])
+def test_parse_time_rejects_invalid_formats(time_str):
+    with pytest.raises(ValueError, match="Invalid time format"):
+        parse_time(time_str)
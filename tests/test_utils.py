@@ -0,0 +1,47 @@
+"""
+Tests for the helpers in ytdownloader.utils.
+"""
+
+import pytest
+
+from ytdownloader.utils import format_filesize, sanitize_filename
+
+
+
+@pytest.mark.parametrize('size, expected', [
+    (1, '1.0 B'),
+    (1023, '1023.0 B'),
+    (1024, '1.0 KB'),
+    (1536, '1.5 KB'),
+    (1048575, '1024.0 KB'),
+    (1048576, '1.0 MB'),
+    (1 << 40, '1.0 TB'),
+    (1 << 50, '1024.0 TB'),
+    ('2048', '2.0 KB'),
+    (0, '0 B'),
+    (-1, '0 B'),
+    (None, 'Unknown'),
+    ('', 'Unknown'),
+    ('n/a', 'Unknown'),
+])
+def test_format_filesize(size, expected):
+    assert format_filesize(size) == expected
+
+@pytest.mark.parametrize('filename, expected', [
+    ('My Video.mp4', 'My Video.mp4'),
+    ('a<b>c:d"e/f\\g|h?i*j', 'a_b_c_d_e_f_g_h_i_j'),
+    ('tab\there\x7fand\x85controls', 'tabhereandcontrols'),
+    ('  ..trailing dots..  ', 'trailing dots'),
+    ('名前 ünïcode.webm', '名前 ünïcode.webm'),
+    (' .\x00. ', 'video'),
+    ('', 'video'),
+])
+def test_sanitize_filename(filename, expected):
+    assert sanitize_filename(filename) == expected
+
+
+def test_sanitize_filename_truncates_but_keeps_extension():
+    sanitized = sanitize_filename('x' * 300 + '.mp4', max_length=100)
+    
+    assert len(sanitized) == 100
+    assert sanitized.endswith('.mp4')
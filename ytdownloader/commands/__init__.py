@@ -0,0 +1,3 @@
+"""
+Subcommands for the ytdownloader CLI, loaded on demand by ytdownloader.cli.
+"""
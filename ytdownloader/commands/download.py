@@ -0,0 +1,202 @@
+"""
+Download command for ytdownloader.
+"""
+
+import os
+import sys
+
+import click
+
+from ..cli import console
+from ..downloader import YouTubeDownloader, validate_youtube_url
+from ..utils import (
+    display_video_info, 
+    display_formats_table, 
+    generate_output_filename, 
+    ensure_directory,
+    confirm_action,
+    remove_file_async
+)
+
+
+@click.command()
+@click.argument('urls', nargs=-1, required=True)
+@click.option(
+    '--output-dir', '-o', 
+    default='downloads', 
+    help='Output directory for downloads.',
+    type=click.Path()
+)
+@click.option(
+    '--quality', '-q', 
+    default='best',
+    type=click.Choice(['best', 'worst', '144p', '240p', '360p', '480p', '720p', '1080p', 'audio']),
+    help='Video quality preference.'
+)
+@click.option(
+    '--filename', '-f',
+    help='Custom filename template (e.g., "%(title)s.%(ext)s").'
+)
+@click.option(
+    '--trim-start', 
+    type=float,
+    help='Remove N seconds from the beginning.'
+)
+@click.option(
+    '--trim-end',
+    type=float, 
+    help='Remove N seconds from the end.'
+)
+@click.option(
+    '--trim',
+    help='Trim to time range (e.g., "30-120" or "1:30-2:45").'
+)
+@click.option(
+    '--audio-only', '-a',
+    is_flag=True,
+    help='Download audio only.'
+)
+@click.option(
+    '--audio-format',
+    default='mp3',
+    type=click.Choice(['mp3', 'm4a', 'opus']),
+    help='Audio format for --audio-only (m4a/opus avoid re-encoding when available).'
+)
+@click.option(
+    '--connections', '-N',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Number of parallel connections per download (default: 1).'
+)
+@click.option(
+    '--info-only', '-i',
+    is_flag=True, 
+    help='Show video information without downloading.'
+)
+@click.option(
+    '--list-formats', '-l',
+    is_flag=True,
+    help='List available formats without downloading.'
+)
+@click.option(
+    '--all', 'show_all',
+    is_flag=True,
+    help='With --list-formats, list every format instead of the 20 best.'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Do not read or write the video info cache.'
+)
+@click.option(
+    '--refresh-meta',
+    is_flag=True,
+    help='Fetch fresh video info instead of using the cache.'
+)
+@click.pass_context
+def download(ctx, urls, output_dir, quality, filename, trim_start, trim_end, trim, audio_only, audio_format, connections, info_only, list_formats, show_all, no_cache, refresh_meta):
+    """
+    Download one or more YouTube videos.
+    
+    URLS: YouTube video URLs to download
+    
+    Examples:
+        ytdownloader download "https://youtube.com/watch?v=dQw4w9WgXcQ"
+        ytdownloader download "URL1" "URL2" "URL3"
+        ytdownloader download "URL" --quality 720p --output-dir ~/Videos
+        ytdownloader download "URL" --trim-start 10 --trim-end 5
+        ytdownloader download "URL" --trim "1:30-3:45"
+        ytdownloader download "URL" --audio-only
+    """
+    verbose = ctx.obj.get('verbose', False)
+    
+    # Validate URLs
+    for url in urls:
+        if not validate_youtube_url(url):
+            console.print(f"❌ [red]Invalid YouTube URL: {url}[/red]")
+            console.print("   Supported formats: youtube.com, youtu.be, m.youtube.com, music.youtube.com")
+            sys.exit(1)
+    
+    # Validate trim options
+    trim_options = [trim_start, trim_end, trim]
+    if sum(1 for opt in trim_options if opt is not None) > 1:
+        console.print("❌ [red]Cannot specify multiple trim options[/red]")
+        sys.exit(1)
+    
+    try:
+        # Initialize downloader
+        ensure_directory(output_dir)
+        downloader = YouTubeDownloader(output_dir=output_dir, quality=quality, use_cache=not no_cache)
+        
+        # Get video info for all URLs in one yt-dlp session
+        if verbose:
+            console.print("📡 Fetching video information...")
+        
+        video_infos = downloader.get_video_info_many(urls, refresh=refresh_meta)
+        
+        # Show info only
+        if info_only:
+            for video_info in video_infos:
+                display_video_info(video_info, console)
+            return
+        
+        # List formats only
+        if list_formats:
+            for video_info in video_infos:
+                formats = downloader.list_formats(video_info, limit=None if show_all else 20)
+                display_formats_table(formats, console)
+            return
+        
+        for url, video_info in zip(urls, video_infos):
+            # Resolve the trim window up front so yt-dlp only fetches that section
+            sections = None
+            if trim_start is not None:
+                sections = (trim_start, None)
+            elif trim_end is not None and video_info.get('duration'):
+                duration = video_info['duration']
+                end_time = duration - trim_end
+                if end_time <= 0:
+                    raise ValueError(f"Cannot remove {trim_end}s from a {duration}s video")
+                sections = (None, end_time)
+            elif trim:
+                # Editing support (ffmpeg) is only loaded when it's needed
+                from ..editor import parse_time_range
+                sections = parse_time_range(trim)
+            
+            if sections is not None:
+                console.print("✂️  [yellow]Downloading requested section only...[/yellow]")
+            
+            # Download the video
+            if audio_only:
+                console.print("🎵 [yellow]Audio-only mode enabled[/yellow]")
+                downloaded_file = downloader.download_audio_only(
+                    url, filename, sections=sections, info=video_info, audio_format=audio_format
+                )
+            else:
+                downloaded_file = downloader.download(
+                    url, filename, sections=sections, connections=connections, info=video_info
+                )
+            
+            # Fall back to trimming locally when the duration wasn't known upfront
+            if trim_end is not None and sections is None:
+                console.print("✂️  [yellow]Applying video trimming...[/yellow]")
+                
+                from ..editor import VideoEditor
+                editor = VideoEditor()
+                
+                # Generate output filename for edited video
+                edited_file = generate_output_filename(downloaded_file, suffix='_trimmed')
+                editor.remove_end(downloaded_file, edited_file, trim_end)
+                
+                # Ask if user wants to keep original
+                if not confirm_action("Keep original file?", default=False):
+                    remove_file_async(downloaded_file)
+                    console.print(f"🗑️  Removed original file: {os.path.basename(downloaded_file)}")
+        
+        console.print("🎉 [green]Download completed successfully![/green]")
+        
+    except Exception as e:
+        console.print(f"❌ [red]Error: {e}[/red]")
+        if verbose:
+            console.print_exception()
+        sys.exit(1)
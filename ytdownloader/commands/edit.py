@@ -0,0 +1,194 @@
+"""
+Edit command for ytdownloader.
+"""
+
+import os
+import sys
+
+import click
+
+from ..cli import console
+from ..utils import display_video_info, generate_output_filename
+
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option(
+    '--output', '-o',
+    help='Output file path.'
+)
+@click.option(
+    '--trim-start',
+    type=float,
+    help='Remove N seconds from the beginning.'
+)
+@click.option(
+    '--trim-end', 
+    type=float,
+    help='Remove N seconds from the end.'
+)
+@click.option(
+    '--trim',
+    help='Trim to time range (e.g., "30-120" or "1:30-2:45").'
+)
+@click.option(
+    '--extract-audio', '-a',
+    is_flag=True,
+    help='Extract audio to separate file.'
+)
+@click.option(
+    '--convert-to',
+    type=click.Choice(['mp4', 'avi', 'mkv', 'mov', 'webm']),
+    help='Convert to different video format.'
+)
+@click.option(
+    '--resize',
+    help='Resize video (e.g., "720p", "1080p", "1280x720").'
+)
+@click.option(
+    '--force-reencode',
+    is_flag=True,
+    help='Re-encode with --convert-to even if the file already has the target codecs.'
+)
+@click.option(
+    '--info', '-i',
+    is_flag=True,
+    help='Show video file information.'
+)
+@click.pass_context
+def edit(
+    ctx, input_file, output, trim_start, trim_end, trim, extract_audio, convert_to, resize,
+    force_reencode, info
+):
+    """
+    Edit a video file.
+    
+    INPUT_FILE: Path to the video file to edit
+    
+    Examples:
+        ytdownloader edit video.mp4 --trim-start 10
+        ytdownloader edit video.mp4 --trim "1:30-3:45" --output edited.mp4
+        ytdownloader edit video.mp4 --extract-audio
+        ytdownloader edit video.mp4 --convert-to mp4 --resize 720p
+    """
+    from ..editor import VideoEditor, parse_time_range
+    
+    verbose = ctx.obj.get('verbose', False)
+    
+    # Validate trim options
+    trim_options = [trim_start, trim_end, trim]
+    if sum(1 for opt in trim_options if opt is not None) > 1:
+        console.print("❌ [red]Cannot specify multiple trim options[/red]")
+        sys.exit(1)
+    
+    try:
+        editor = VideoEditor()
+        
+        # Show info only
+        if info:
+            video_info = editor.get_video_info(input_file)
+            display_video_info(video_info, console)
+            return
+        
+        operations = []
+        
+        # Trim operations
+        trim_range = None
+        if trim_start is not None:
+            trim_range = (trim_start, None)
+            operations.append(f"removed {trim_start}s from start")
+            
+        elif trim_end is not None:
+            duration = editor.get_video_info(input_file)['duration']
+            end_time = duration - trim_end
+            if end_time <= 0:
+                raise ValueError(f"Cannot remove {trim_end}s from a {duration}s video")
+            trim_range = (None, end_time)
+            operations.append(f"removed {trim_end}s from end")
+            
+        elif trim:
+            trim_range = parse_time_range(trim)
+            operations.append(f"trimmed to range {trim}")
+        
+        # Conversion operations
+        vcodec = acodec = None
+        if convert_to:
+            # Determine appropriate codecs
+            codec_map = {
+                'mp4': ('libx264', 'aac'),
+                'avi': ('libx264', 'mp3'), 
+                'mkv': ('libx264', 'aac'),
+                'mov': ('libx264', 'aac'),
+                'webm': ('libvpx-vp9', 'libopus')
+            }
+            
+            vcodec, acodec = codec_map.get(convert_to, ('libx264', 'aac'))
+            operations.append(f"converted to {convert_to}")
+        
+        # Resize operations
+        width = height = scale = None
+        if resize:
+            if resize.endswith('p'):
+                # Handle 720p, 1080p format
+                scale = resize
+            elif 'x' in resize:
+                # Handle WIDTHxHEIGHT format
+                try:
+                    width, height = map(int, resize.split('x'))
+                except ValueError:
+                    console.print(f"❌ [red]Invalid resize format: {resize}[/red]")
+                    sys.exit(1)
+            else:
+                console.print(f"❌ [red]Invalid resize format: {resize}. Use '720p' or '1280x720'[/red]")
+                sys.exit(1)
+            
+            operations.append(f"resized to {resize}")
+        
+        # Name the video output after the first operation applied
+        if trim_range or convert_to or resize:
+            if not output:
+                suffix = '_trimmed' if trim_range else '_converted' if convert_to else '_resized'
+                output = generate_output_filename(input_file, suffix=suffix, extension=convert_to)
+            elif convert_to and not output.endswith(f'.{convert_to}'):
+                # Add correct extension if not present
+                output = f"{os.path.splitext(output)[0]}.{convert_to}"
+        else:
+            output = None
+        
+        # Audio extraction
+        audio_output = None
+        if extract_audio:
+            audio_output = generate_output_filename(input_file, suffix='_audio', extension='mp3')
+            operations.append("extracted audio")
+        
+        # Run everything as a single ffmpeg pass over the input
+        final_output = input_file
+        if output:
+            final_output = editor.pipeline(
+                input_file,
+                output,
+                trim=trim_range,
+                width=width,
+                height=height,
+                scale=scale,
+                video_codec=vcodec,
+                audio_codec=acodec,
+                extract_audio_to=audio_output,
+                force_reencode=force_reencode
+            )
+        elif audio_output:
+            editor.extract_audio(input_file, audio_output)
+        
+        if operations:
+            console.print("🎉 [green]Video editing completed![/green]")
+            console.print(f"   Operations: {', '.join(operations)}")
+            if final_output != input_file:
+                console.print(f"   Output: {os.path.basename(final_output)}")
+        else:
+            console.print("ℹ️  [yellow]No operations specified. Use --help for available options.[/yellow]")
+        
+    except Exception as e:
+        console.print(f"❌ [red]Error: {e}[/red]")
+        if verbose:
+            console.print_exception()
+        sys.exit(1)
@@ -0,0 +1,56 @@
+"""
+Extract-audio command for ytdownloader.
+"""
+
+import os
+import sys
+
+import click
+
+from ..cli import console
+from ..utils import generate_output_filename
+
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option(
+    '--format', '-f',
+    default='mp3',
+    type=click.Choice(['mp3', 'wav', 'aac', 'flac']),
+    help='Audio format for extraction.'
+)
+@click.option(
+    '--output', '-o',
+    help='Output file path.'
+)
+@click.pass_context
+def extract_audio(ctx, input_file, format, output):
+    """
+    Extract audio from a video file.
+    
+    INPUT_FILE: Path to the video file
+    
+    Examples:
+        ytdownloader extract-audio video.mp4
+        ytdownloader extract-audio video.mp4 --format wav --output audio.wav
+    """
+    from ..editor import VideoEditor
+    
+    verbose = ctx.obj.get('verbose', False)
+    
+    try:
+        editor = VideoEditor()
+        
+        if not output:
+            output = generate_output_filename(input_file, suffix='_audio', extension=format)
+        
+        editor.extract_audio(input_file, output, format=format)
+        
+        console.print("🎉 [green]Audio extraction completed![/green]")
+        console.print(f"   Output: {os.path.basename(output)}")
+        
+    except Exception as e:
+        console.print(f"❌ [red]Error: {e}[/red]")
+        if verbose:
+            console.print_exception()
+        sys.exit(1)
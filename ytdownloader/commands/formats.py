@@ -0,0 +1,63 @@
+"""
+Formats command for ytdownloader.
+"""
+
+import sys
+
+import click
+
+from ..cli import console
+from ..downloader import YouTubeDownloader, validate_youtube_url
+from ..utils import display_formats_table
+
+
+@click.command()
+@click.argument('urls', nargs=-1, required=True)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Do not read or write the video info cache.'
+)
+@click.option(
+    '--refresh-meta',
+    is_flag=True,
+    help='Fetch fresh video info instead of using the cache.'
+)
+@click.option(
+    '--all', 'show_all',
+    is_flag=True,
+    help='List every format instead of the 20 best.'
+)
+@click.pass_context
+def formats(ctx, urls, no_cache, refresh_meta, show_all):
+    """
+    List available download formats for YouTube videos.
+    
+    URLS: One or more YouTube video URLs
+    
+    Examples:
+        ytdownloader formats "https://youtube.com/watch?v=dQw4w9WgXcQ"
+    """
+    verbose = ctx.obj.get('verbose', False)
+    
+    # Validate URLs
+    for url in urls:
+        if not validate_youtube_url(url):
+            console.print(f"❌ [red]Invalid YouTube URL: {url}[/red]")
+            sys.exit(1)
+    
+    try:
+        downloader = YouTubeDownloader(use_cache=not no_cache)
+        
+        console.print("📡 [yellow]Fetching available formats...[/yellow]")
+        video_infos = downloader.get_video_info_many(urls, refresh=refresh_meta)
+        
+        for video_info in video_infos:
+            formats_list = downloader.list_formats(video_info, limit=None if show_all else 20)
+            display_formats_table(formats_list, console)
+        
+    except Exception as e:
+        console.print(f"❌ [red]Error: {e}[/red]")
+        if verbose:
+            console.print_exception()
+        sys.exit(1)
@@ -0,0 +1,57 @@
+"""
+Info command for ytdownloader.
+"""
+
+import sys
+
+import click
+
+from ..cli import console
+from ..downloader import YouTubeDownloader, validate_youtube_url
+from ..utils import display_video_info
+
+
+@click.command()
+@click.argument('urls', nargs=-1, required=True)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Do not read or write the video info cache.'
+)
+@click.option(
+    '--refresh-meta',
+    is_flag=True,
+    help='Fetch fresh video info instead of using the cache.'
+)
+@click.pass_context
+def info(ctx, urls, no_cache, refresh_meta):
+    """
+    Show information about YouTube videos without downloading.
+    
+    URLS: One or more YouTube video URLs
+    
+    Examples:
+        ytdownloader info "https://youtube.com/watch?v=dQw4w9WgXcQ"
+    """
+    verbose = ctx.obj.get('verbose', False)
+    
+    # Validate URLs
+    for url in urls:
+        if not validate_youtube_url(url):
+            console.print(f"❌ [red]Invalid YouTube URL: {url}[/red]")
+            sys.exit(1)
+    
+    try:
+        downloader = YouTubeDownloader(use_cache=not no_cache)
+        
+        console.print("📡 [yellow]Fetching video information...[/yellow]")
+        video_infos = downloader.get_video_info_many(urls, refresh=refresh_meta)
+        
+        for video_info in video_infos:
+            display_video_info(video_info, console)
+        
+    except Exception as e:
+        console.print(f"❌ [red]Error: {e}[/red]")
+        if verbose:
+            console.print_exception()
+        sys.exit(1)
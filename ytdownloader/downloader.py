@@ -2,90 +2,477 @@
 YouTube video downloader using yt-dlp.
 """
 
+import heapq
 import os
+import re
+import shelve
 import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, Any, List
-import yt_dlp
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, Any, List, Tuple, Union
+from urllib.parse import urlparse, parse_qs
 from rich.console import Console
-from rich.progress import Progress, TaskID
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TaskID,
+    TextColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+
+# Size of each HTTP Range request issued by the parallel downloader
+RANGE_CHUNK_SIZE = 10 * 1024 * 1024
+
+# Bytes read from a response before writing them out, bounding memory per worker
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+console = Console()
+
+# Cached video info expires quickly since the signed format URLs do too
+INFO_CACHE_TTL = 10 * 60
+
+# Matches the YouTube hosts accepted by validate_youtube_url, with any path
+_YOUTUBE_URL_RE = re.compile(
+    r'^https?://(?:(?:www\.|m\.|music\.)?youtube\.com|youtu\.be)(?:[/?#]|$)',
+    re.IGNORECASE
+)
+
+# Serializes seek+write on platforms without os.pwrite (Windows)
+_write_lock = threading.Lock()
+
+# Keys yt-dlp adds to an info dict when selecting formats and downloading;
+# the same ones its sanitize_info(remove_private_keys=True) drops
+_SELECTION_KEYS = frozenset({
+    'requested_downloads', 'requested_formats', 'requested_subtitles',
+    'requested_entries', 'filepath', '_filename', 'filename', 'infojson_filename',
+})
+
+
+def _height_selector(height: int) -> str:
+    """Build the yt-dlp format selector for videos no taller than height."""
+    return f'bv*[height<={height}]+ba/b[height<={height}]/wv*[height<={height}]+wa/w[height<={height}]'
+
+
+def _default_cache_dir() -> Path:
+    """Get the per-user cache directory for ytdownloader."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'ytdownloader'
+
+
+def _video_id(url: str) -> str:
+    """Extract the canonical video ID from a YouTube URL, falling back to the URL itself."""
+    parsed = urlparse(url)
+    if parsed.netloc.lower().endswith('youtu.be'):
+        return parsed.path.strip('/').split('/')[0] or url
+    video_ids = parse_qs(parsed.query).get('v')
+    return video_ids[0] if video_ids else url
+
+
+def _unselected_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get a copy of extracted info that format selection can run on again.
+    
+    process_ie_result only overwrites the top-level keys of the formats it
+    picks, so a requested_formats pair left from an earlier selection would
+    otherwise still be what gets downloaded.
+    """
+    return {
+        key: value for key, value in info.items()
+        if key not in _SELECTION_KEYS and not key.startswith('__')
+    }
+
+
+def _write_at(fd: int, data: bytes, offset: int) -> None:
+    """Write data at a fixed offset of an open file descriptor."""
+    if hasattr(os, 'pwrite'):
+        os.pwrite(fd, data, offset)
+    else:
+        with _write_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            os.write(fd, data)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve size bytes for fd up front to avoid fragmentation from out-of-order writes."""
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass  # Filesystem doesn't support it, fall back to a sparse file
+    os.ftruncate(fd, size)
+
+
+def _fetch_range(url: str, headers: Dict[str, str], fd: int, start: int, end: int, retries: int = 3) -> int:
+    """
+    Download bytes start-end (inclusive) of url into fd at the same offset.
+    
+    Returns:
+        Number of bytes written
+    """
+    request = urllib.request.Request(url, headers={**headers, 'Range': f'bytes={start}-{end}'})
+    expected = end - start + 1
+    
+    for attempt in range(retries):
+        try:
+            written = 0
+            with urllib.request.urlopen(request, timeout=30) as response:
+                if response.status != 206:
+                    raise RuntimeError(f"Server ignored Range request (HTTP {response.status})")
+                # Stream the body straight to disk instead of buffering the whole range
+                while True:
+                    data = response.read(STREAM_BUFFER_SIZE)
+                    if not data:
+                        break
+                    _write_at(fd, data, start + written)
+                    written += len(data)
+            if written != expected:
+                raise RuntimeError(f"Short read: got {written} of {expected} bytes")
+            return expected
+        except Exception:
+            if attempt == retries - 1:
+                raise
+    raise RuntimeError(f"Failed to fetch bytes {start}-{end}: no attempts made (retries={retries})")
 
 
 class YouTubeDownloader:
     """Handle YouTube video downloads with yt-dlp."""
     
-    def __init__(self, output_dir: str = "downloads", quality: str = "best"):
+    # Named quality presets; "<height>p" values are built by _height_selector
+    _QUALITY_MAP = {
+        'best': 'bv*+ba/b',
+        'worst': 'wv*+wa/w',
+        'audio': 'ba/best',
+    }
+    
+    # Audio selectors preferring a stream already in the target codec, so
+    # extraction is a remux instead of a transcode whenever one exists
+    _AUDIO_FORMATS = {
+        'mp3': 'ba/best',
+        'm4a': 'ba[acodec^=mp4a]/ba/best',
+        'opus': 'ba[acodec=opus]/ba/best',
+    }
+    
+    def __init__(self, output_dir: str = "downloads", quality: str = "best", use_cache: bool = True):
         """
         Initialize the downloader.
         
         Args:
             output_dir: Directory to save downloaded videos
             quality: Video quality preference (best, worst, 720p, etc.)
+            use_cache: Cache extracted video info on disk between runs
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.quality = quality
-        self.console = Console()
+        self.use_cache = use_cache
+        self.cache_file = _default_cache_dir() / 'meta.db'
+        self.console = console
+        self.progress = Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+            console=console,
+        )
+        self._tasks: Dict[str, TaskID] = {}
         
-    def _get_ydl_opts(self, filename_template: Optional[str] = None) -> Dict[str, Any]:
+    def _update_progress(self, d: Dict[str, Any], description: str) -> None:
+        """Advance the progress bar for a yt-dlp 'downloading' event."""
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        task_id = self._tasks.get(d['filename'])
+        if task_id is None:
+            task_id = self.progress.add_task(description, total=total)
+            self._tasks[d['filename']] = task_id
+        # Rendering is rate-limited by rich, so per-event updates are cheap
+        self.progress.update(task_id, completed=d.get('downloaded_bytes', 0), total=total)
+    
+    def _finish_progress(self, filename: Optional[str] = None) -> None:
+        """Remove the progress bar for filename, or every bar left over when None."""
+        filenames = [filename] if filename is not None else list(self._tasks)
+        for name in filenames:
+            task_id = self._tasks.pop(name, None)
+            if task_id is not None:
+                # Otherwise the shared Progress redraws it on every later download
+                self.progress.remove_task(task_id)
+    
+    def _read_cached_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached video info for url if present and not expired."""
+        try:
+            with shelve.open(str(self.cache_file), flag='r') as cache:
+                entry = cache.get(_video_id(url))
+        except Exception:
+            return None  # Missing or unreadable cache is just a miss
+        
+        if entry and time.time() - entry['time'] < INFO_CACHE_TTL:
+            return entry['info']
+        return None
+    
+    def _write_cached_info(self, url: str, info: Dict[str, Any]) -> None:
+        """Store a sanitized copy of video info for url in the on-disk cache."""
+        try:
+            import yt_dlp
+            
+            # Stored like --write-info-json, without the format selection
+            info = yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True)
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(str(self.cache_file)) as cache:
+                cache[_video_id(url)] = {'time': time.time(), 'info': info}
+        except Exception:
+            pass  # Caching is best-effort
+    
+
+    def _get_ydl_opts(
+        self,
+        filename_template: Optional[str] = None,
+        sections: Optional[Tuple[Optional[float], Optional[float]]] = None
+    ) -> Dict[str, Any]:
         """Get yt-dlp options configuration."""
         opts = {
             'outtmpl': str(self.output_dir / (filename_template or '%(title)s.%(ext)s')),
             'format': self._parse_quality(self.quality),
             'noplaylist': True,  # Download single video, not playlist
             'extract_flat': False,
+            'noprogress': True,  # Progress is rendered by our own progress bar
         }
+        
+        if sections is not None:
+            from yt_dlp.utils import download_range_func
+            
+            # Only fetch the requested time range instead of the whole video
+            start, end = sections
+            opts['download_ranges'] = download_range_func(
+                None, [(start or 0, end if end is not None else float('inf'))]
+            )
+            opts['force_keyframes_at_cuts'] = True
+        
         return opts
     
+    def _download_ranged(
+        self,
+        ydl: 'yt_dlp.YoutubeDL',
+        info: Dict[str, Any],
+        connections: int,
+        progress_hook: Callable[[Dict[str, Any]], None]
+    ) -> Optional[str]:
+        """
+        Fetch the selected formats with parallel HTTP Range requests.
+        
+        Args:
+            ydl: YoutubeDL instance the info was extracted with
+            info: Processed video info with the formats already selected
+            connections: Number of concurrent connections
+            progress_hook: Hook receiving yt-dlp style progress dictionaries
+            
+        Returns:
+            Path to downloaded file, or None if the formats can't be fetched this way
+        """
+        formats = info.get('requested_formats') or [info]
+        if not all(
+            fmt.get('protocol') in ('http', 'https') and fmt.get('url') and fmt.get('filesize')
+            for fmt in formats
+        ):
+            return None
+        
+        final_file = ydl.prepare_filename(info)
+        if os.path.exists(final_file):
+            progress_hook({'status': 'finished', 'filename': final_file})
+            return final_file
+        
+        if len(formats) == 1:
+            outputs = [final_file]
+        else:
+            base_name = os.path.splitext(final_file)[0]
+            outputs = [f"{base_name}.f{fmt['format_id']}.{fmt['ext']}" for fmt in formats]
+        # Written under a .part name so an interrupted download is never taken
+        # for a finished one
+        parts = [f"{output}.part" for output in outputs]
+        
+        total_bytes = sum(fmt['filesize'] for fmt in formats)
+        downloaded_bytes = 0
+        fds = []
+        
+        try:
+            try:
+                with ThreadPoolExecutor(max_workers=connections) as executor:
+                    futures = []
+                    for fmt, part in zip(formats, parts):
+                        fd = os.open(
+                            part,
+                            os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+                            0o644
+                        )
+                        fds.append(fd)
+                        _preallocate(fd, fmt['filesize'])
+                    
+                        headers = fmt.get('http_headers') or {}
+                        for start in range(0, fmt['filesize'], RANGE_CHUNK_SIZE):
+                            end = min(start + RANGE_CHUNK_SIZE, fmt['filesize']) - 1
+                            futures.append(executor.submit(_fetch_range, fmt['url'], headers, fd, start, end))
+                
+                    try:
+                        for future in as_completed(futures):
+                            downloaded_bytes += future.result()
+                            progress_hook({
+                                'status': 'downloading',
+                                'filename': final_file,
+                                'downloaded_bytes': downloaded_bytes,
+                                'total_bytes': total_bytes,
+                            })
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+            finally:
+                for fd in fds:
+                    os.close(fd)
+        except BaseException:
+            # Also on Ctrl-C, which would otherwise leave preallocated zeros behind
+            for part in parts:
+                if os.path.exists(part):
+                    os.remove(part)
+            raise
+        
+        # Every range has arrived
+        for part, output in zip(parts, outputs):
+            os.replace(part, output)
+        
+        if len(outputs) > 1:
+            from yt_dlp.postprocessor import FFmpegMergerPP
+            
+            info['__files_to_merge'] = outputs
+            info['filepath'] = final_file
+            ydl.run_pp(FFmpegMergerPP(ydl), info)
+        
+        progress_hook({'status': 'finished', 'filename': final_file})
+        return final_file
+    
     def _parse_quality(self, quality: str) -> str:
         """Convert quality preference to yt-dlp format string."""
-        quality_map = {
-            'best': 'bv*+ba/b',
-            'worst': 'wv*+wa/w', 
-            'audio': 'ba/best',
-            '144p': 'bv*[height<=144]+ba/b[height<=144]/wv*[height<=144]+wa/w[height<=144]',
-            '240p': 'bv*[height<=240]+ba/b[height<=240]/wv*[height<=240]+wa/w[height<=240]',
-            '360p': 'bv*[height<=360]+ba/b[height<=360]/wv*[height<=360]+wa/w[height<=360]',
-            '480p': 'bv*[height<=480]+ba/b[height<=480]/wv*[height<=480]+wa/w[height<=480]',
-            '720p': 'bv*[height<=720]+ba/b[height<=720]/wv*[height<=720]+wa/w[height<=720]',
-            '1080p': 'bv*[height<=1080]+ba/b[height<=1080]/wv*[height<=1080]+wa/w[height<=1080]',
-        }
-        return quality_map.get(quality, quality)
+        if quality.endswith('p') and quality[:-1].isdigit():
+            return _height_selector(int(quality[:-1]))
+        return self._QUALITY_MAP.get(quality, quality)
     
-    def get_video_info(self, url: str) -> Dict[str, Any]:
+    def get_video_info(self, url: str, refresh: bool = False, sanitize: bool = False) -> Dict[str, Any]:
         """
         Extract video metadata without downloading.
         
         Args:
             url: YouTube video URL
+            refresh: Ignore cached info and fetch it again
+            sanitize: Return a JSON-serializable copy (cache hits always are)
             
         Returns:
             Video metadata dictionary
         """
+        return self.get_video_info_many([url], refresh=refresh, sanitize=sanitize)[0]
+    
+    def get_video_info_many(
+        self,
+        urls: List[str],
+        refresh: bool = False,
+        sanitize: bool = False,
+        max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract metadata for several videos in one yt-dlp session.
+        
+        Extraction runs on a small thread pool. YoutubeDL instances are not
+        thread-safe, so each worker gets its own and reuses it for every URL
+        it handles, keeping the player and signature data cached per session.
+        
+        Args:
+            urls: YouTube video URLs
+            refresh: Ignore cached info and fetch it again
+            sanitize: Return JSON-serializable copies (cache hits always are)
+            max_workers: Maximum number of concurrent extractions
+            
+        Returns:
+            Video metadata dictionaries, in the same order as urls
+        """
+        infos: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        if self.use_cache and not refresh:
+            infos = [self._read_cached_info(url) for url in urls]
+        
+        pending = [i for i, info in enumerate(infos) if info is None]
+        if not pending:
+            return infos
+        
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
         }
         
+        local = threading.local()
+        sessions = []
+        lock = threading.Lock()
+        
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # Imported lazily since yt-dlp loads hundreds of extractors
+            import yt_dlp
+            
+            def extract(url):
+                ydl = getattr(local, 'ydl', None)
+                if ydl is None:
+                    ydl = local.ydl = yt_dlp.YoutubeDL(ydl_opts)
+                    with lock:
+                        sessions.append(ydl)
                 info = ydl.extract_info(url, download=False)
-                return ydl.sanitize_info(info)
+                # Deep-copying the whole info dict is only needed to export it
+                if sanitize:
+                    info = ydl.sanitize_info(info, remove_private_keys=True)
+                return info
+            
+            try:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                    extracted = executor.map(extract, [urls[i] for i in pending])
+                    for i, info in zip(pending, extracted):
+                        infos[i] = info
+            finally:
+                for ydl in sessions:
+                    ydl.close()
         except Exception as e:
             raise RuntimeError(f"Failed to extract video info: {e}")
+        
+        if self.use_cache:
+            for i in pending:
+                self._write_cached_info(urls[i], infos[i])
+        return infos
     
-    def download(self, url: str, filename_template: Optional[str] = None) -> str:
+    def download(
+        self,
+        url: str,
+        filename_template: Optional[str] = None,
+        sections: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        connections: int = 1,
+        info: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Download a YouTube video.
         
         Args:
             url: YouTube video URL
             filename_template: Custom filename template (optional)
+            sections: (start, end) time range in seconds to download (optional)
+            connections: Number of parallel connections used to fetch the video;
+                above 1 plain HTTP formats are fetched with parallel Range requests
+            info: Previously extracted info from get_video_info to skip re-extraction (optional)
             
         Returns:
             Path to downloaded file
         """
-        ydl_opts = self._get_ydl_opts(filename_template)
+        ydl_opts = self._get_ydl_opts(filename_template, sections)
+        ydl_opts['concurrent_fragment_downloads'] = connections
         
         # Add progress hook
         downloaded_file = None
@@ -95,18 +482,45 @@ class YouTubeDownloader:
             if d['status'] == 'finished':
                 downloaded_file = d['filename']
                 self.console.print(f"✅ Download completed: {os.path.basename(downloaded_file)}")
+                self._finish_progress(downloaded_file)
             elif d['status'] == 'downloading':
-                if 'total_bytes' in d and 'downloaded_bytes' in d:
-                    percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                    self.console.print(f"📥 Downloading... {percent:.1f}%", end='\r')
+                self._update_progress(d, "📥 Downloading")
+        
+        def postprocessor_hook(d):
+            nonlocal downloaded_file
+            # Postprocessors (merge, audio extraction) report the final file path
+            if d['status'] == 'finished' and d.get('info_dict', {}).get('filepath'):
+                downloaded_file = d['info_dict']['filepath']
         
         ydl_opts['progress_hooks'] = [progress_hook]
+        ydl_opts['postprocessor_hooks'] = [postprocessor_hook]
         
         try:
             self.console.print(f"🎬 Starting download from: {url}")
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            import yt_dlp
+            
+            with self.progress, yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if connections > 1 and sections is None:
+                    # Use yt-dlp for extraction only and fetch the bytes ourselves
+                    if info is None:
+                        info = ydl.extract_info(url, download=False)
+                    else:
+                        # Re-run format selection on the prefetched info with our options
+                        info = ydl.process_ie_result(_unselected_info(info), download=False)
+                    try:
+                        ranged_file = self._download_ranged(ydl, info, connections, progress_hook)
+                    except Exception as e:
+                        # e.g. HTTP 403 or a short read; yt-dlp's downloader has its own
+                        # retries and honours cookies, proxies and rate limits
+                        self.console.print(f"⚠️  [yellow]Parallel download failed ({e}), retrying with yt-dlp[/yellow]")
+                        ranged_file = None
+                    if ranged_file is None:
+                        ydl.process_ie_result(_unselected_info(info), download=True)
+                elif info is not None:
+                    ydl.process_ie_result(_unselected_info(info), download=True)
+                else:
+                    ydl.download([url])
             
             if downloaded_file:
                 return downloaded_file
@@ -115,25 +529,44 @@ class YouTubeDownloader:
                 
         except Exception as e:
             raise RuntimeError(f"Download failed: {e}")
+        finally:
+            self._finish_progress()
     
-    def download_audio_only(self, url: str, filename_template: Optional[str] = None) -> str:
+    def download_audio_only(
+        self,
+        url: str,
+        filename_template: Optional[str] = None,
+        sections: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        info: Optional[Dict[str, Any]] = None,
+        audio_format: str = 'mp3'
+    ) -> str:
         """
         Download audio-only version of a YouTube video.
         
         Args:
             url: YouTube video URL
             filename_template: Custom filename template (optional)
+            sections: (start, end) time range in seconds to download (optional)
+            info: Previously extracted info from get_video_info to skip re-extraction (optional)
+            audio_format: Output audio format (mp3, m4a, opus); only mp3 always re-encodes
             
         Returns:
             Path to downloaded audio file
         """
-        ydl_opts = self._get_ydl_opts(filename_template)
-        ydl_opts['format'] = 'ba/best'  # Best audio
-        ydl_opts['postprocessors'] = [{
+        if audio_format not in self._AUDIO_FORMATS:
+            raise ValueError(f"Unsupported audio format: {audio_format}")
+        
+        ydl_opts = self._get_ydl_opts(filename_template, sections)
+        ydl_opts['format'] = self._AUDIO_FORMATS[audio_format]
+        
+        # yt-dlp copies the stream when it already matches the preferred codec
+        extract_audio = {
             'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': '192',
-        }]
+            'preferredcodec': audio_format,
+        }
+        if audio_format == 'mp3':
+            extract_audio['preferredquality'] = '192'
+        ydl_opts['postprocessors'] = [extract_audio]
         
         downloaded_file = None
         
@@ -142,62 +575,85 @@ class YouTubeDownloader:
             if d['status'] == 'finished':
                 downloaded_file = d['filename']
                 self.console.print(f"✅ Audio extraction completed: {os.path.basename(downloaded_file)}")
+                self._finish_progress(downloaded_file)
             elif d['status'] == 'downloading':
-                if 'total_bytes' in d and 'downloaded_bytes' in d:
-                    percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                    self.console.print(f"📥 Downloading audio... {percent:.1f}%", end='\r')
+                self._update_progress(d, "📥 Downloading audio")
+        
+        def postprocessor_hook(d):
+            nonlocal downloaded_file
+            # Postprocessors (merge, audio extraction) report the final file path
+            if d['status'] == 'finished' and d.get('info_dict', {}).get('filepath'):
+                downloaded_file = d['info_dict']['filepath']
         
         ydl_opts['progress_hooks'] = [progress_hook]
+        ydl_opts['postprocessor_hooks'] = [postprocessor_hook]
         
         try:
             self.console.print(f"🎵 Starting audio download from: {url}")
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            import yt_dlp
+            
+            with self.progress, yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                if info is not None:
+                    ydl.process_ie_result(_unselected_info(info), download=True)
+                else:
+                    ydl.download([url])
             
             if downloaded_file:
-                # yt-dlp might change extension after post-processing
-                base_name = os.path.splitext(downloaded_file)[0]
-                mp3_file = f"{base_name}.mp3"
-                if os.path.exists(mp3_file):
-                    return mp3_file
                 return downloaded_file
             else:
                 raise RuntimeError("Download completed but file path not captured")
                 
         except Exception as e:
             raise RuntimeError(f"Audio download failed: {e}")
+        finally:
+            self._finish_progress()
     
-    def list_formats(self, url: str) -> List[Dict[str, Any]]:
+    def list_formats(
+        self,
+        url_or_info: Union[str, Dict[str, Any]],
+        refresh: bool = False,
+        limit: Optional[int] = 20
+    ) -> Iterator[Dict[str, Any]]:
         """
         List available formats for a video.
         
         Args:
-            url: YouTube video URL
+            url_or_info: YouTube video URL, or info already fetched with get_video_info
+            refresh: Ignore cached info and fetch it again (URL only)
+            limit: Only list this many formats (None for all); best (height, bitrate) first either way
             
         Returns:
-            List of available formats
+            Iterator over available formats
         """
         try:
-            info = self.get_video_info(url)
+            if isinstance(url_or_info, dict):
+                info = url_or_info
+            else:
+                info = self.get_video_info(url_or_info, refresh=refresh)
             formats = info.get('formats', [])
             
-            # Filter and format the information
-            formatted_formats = []
-            for fmt in formats:
-                formatted_formats.append({
-                    'format_id': fmt.get('format_id'),
-                    'ext': fmt.get('ext'),
-                    'resolution': fmt.get('resolution', 'audio only' if fmt.get('vcodec') == 'none' else 'unknown'),
-                    'filesize': fmt.get('filesize'),
-                    'vcodec': fmt.get('vcodec'),
-                    'acodec': fmt.get('acodec'),
-                })
-            
-            return formatted_formats
+            key = lambda f: (f.get('height') or 0, f.get('tbr') or 0)
+            if limit is None:
+                formats = sorted(formats, key=key, reverse=True)
+            else:
+                formats = heapq.nlargest(limit, formats, key=key)
             
         except Exception as e:
             raise RuntimeError(f"Failed to list formats: {e}")
+        
+        # Filter and format the information lazily, row by row
+        return (
+            {
+                'format_id': fmt.get('format_id'),
+                'ext': fmt.get('ext'),
+                'resolution': fmt.get('resolution', 'audio only' if fmt.get('vcodec') == 'none' else 'unknown'),
+                'filesize': fmt.get('filesize'),
+                'vcodec': fmt.get('vcodec'),
+                'acodec': fmt.get('acodec'),
+            }
+            for fmt in formats
+        )
 
 
 def validate_youtube_url(url: str) -> bool:
@@ -210,16 +666,4 @@ def validate_youtube_url(url: str) -> bool:
     Returns:
         True if valid YouTube URL, False otherwise
     """
-    youtube_domains = [
-        'youtube.com',
-        'www.youtube.com', 
-        'youtu.be',
-        'm.youtube.com'
-    ]
-    
-    try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return parsed.netloc.lower() in youtube_domains
-    except:
-        return False
\ No newline at end of file
+    return isinstance(url, str) and _YOUTUBE_URL_RE.match(url) is not None
@@ -2,14 +2,307 @@
 Video editing functionality using ffmpeg-python.
 """
 
+import asyncio
+import functools
 import os
+import shutil
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union
 import ffmpeg
 from rich.console import Console
 
 
+# Input-side seeks land this many seconds before the requested start so the
+# trim filter only has to decode a fraction of a second to be frame-accurate
+SEEK_MARGIN = 0.15
+
+# Render node used for VAAPI encoding
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+# H.264 encoders in order of preference, with their output options
+H264_ENCODERS = {
+    'h264_nvenc': {'preset': 'p4', 'tune': 'hq'},
+    'h264_vaapi': {'rc_mode': 'CQP'},
+    'h264_qsv': {'preset': 'medium'},
+    'h264_videotoolbox': {},
+    'libx264': {},
+}
+
+# Scale filter and decoder options that keep frames in GPU memory from
+# decode to encode, per hardware encoder
+GPU_SCALERS = {
+    'h264_nvenc': ('scale_cuda', {'hwaccel': 'cuda', 'hwaccel_output_format': 'cuda'}),
+    'h264_vaapi': ('scale_vaapi', {
+        'hwaccel': 'vaapi', 'hwaccel_output_format': 'vaapi', 'vaapi_device': VAAPI_DEVICE,
+    }),
+}
+
+# Concurrent encode sessions consumer NVIDIA drivers allow
+NVENC_SESSIONS = 3
+
+# Outputs whose muxer can move the index (moov atom) to the front
+_FASTSTART_EXTENSIONS = frozenset({'.mp4', '.m4v', '.mov', '.m4a'})
+
+# Codec each encoder produces, as ffprobe reports it
+_ENCODER_CODECS = {
+    'libx264': 'h264',
+    'libx265': 'hevc',
+    'libvpx': 'vp8',
+    'libvpx-vp9': 'vp9',
+    'libaom-av1': 'av1',
+    'libsvtav1': 'av1',
+    'libmp3lame': 'mp3',
+    'libopus': 'opus',
+    'libvorbis': 'vorbis',
+    'libfdk_aac': 'aac',
+}
+
+# Audio codecs each extraction format can hold without re-encoding
+_AUDIO_FORMAT_CODECS = {
+    'mp3': ('mp3',),
+    'aac': ('aac',),
+    'm4a': ('aac', 'alac'),
+    'opus': ('opus',),
+    'ogg': ('vorbis', 'opus'),
+    'flac': ('flac',),
+}
+
+# Option the hardware H.264 encoders take in place of -crf, which every
+# other encoder (libx264, libx265, libvpx-vp9, libaom-av1...) accepts;
+# None means the encoder has no constant-quality equivalent
+_QUALITY_OPTIONS = {
+    'h264_nvenc': 'cq',
+    'h264_vaapi': 'qp',
+    'h264_qsv': 'global_quality',
+    'h264_videotoolbox': None,
+}
+
+
+def _parse_fraction(value: str) -> float:
+    """Parse an ffprobe rational such as '30000/1001' into a float."""
+    num, sep, den = value.partition('/')
+    if not sep:
+        return float(num)
+    den_value = float(den)
+    return float(num) / den_value if den_value else 0.0
+
+
+def _codec_of(encoder: str) -> str:
+    """Get the codec name ffprobe reports for streams made by an encoder."""
+    if encoder in _ENCODER_CODECS:
+        return _ENCODER_CODECS[encoder]
+    # Hardware encoders are named <codec>_<api>, e.g. h264_nvenc or hevc_vaapi
+    return encoder.split('_')[0]
+
+
+def _muxer_options(output_file: str) -> dict:
+    """Get muxer options for an output file."""
+    # Write the index up front so the file can play while it's still loading
+    if os.path.splitext(output_file)[1].lower() in _FASTSTART_EXTENSIONS:
+        return {'movflags': '+faststart'}
+    return {}
+
+
+def _encoder_options(defaults: dict, preset: Optional[str] = None) -> dict:
+    """Get output options for a video encoder, letting it use every core."""
+    options = dict(defaults, threads=0)
+    if preset:
+        options['preset'] = preset
+    return options
+
+
+def _encoder_works(encoder: str) -> bool:
+    """Check that an encoder can actually open a device by encoding one frame."""
+    args = ['ffmpeg', '-hide_banner', '-loglevel', 'error']
+    filters = []
+    if encoder == 'h264_vaapi':
+        args += ['-vaapi_device', VAAPI_DEVICE]
+        filters = ['-vf', 'format=nv12,hwupload']
+    args += [
+        '-f', 'lavfi', '-i', 'color=black:size=256x256:duration=0.1',
+        *filters, '-frames:v', '1', '-c:v', encoder, '-f', 'null', '-',
+    ]
+    try:
+        return subprocess.run(args, capture_output=True, timeout=15).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _select_h264_encoder() -> str:
+    """
+    Pick the fastest usable H.264 encoder.
+    
+    Builds commonly list hardware encoders the machine has no device for, so
+    each candidate is tried on a single frame before it is chosen.
+    """
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'], capture_output=True, text=True
+        )
+    except OSError:
+        return 'libx264'
+    
+    available = {
+        fields[1] for fields in (line.split() for line in result.stdout.splitlines())
+        if len(fields) > 1
+    }
+    for encoder in H264_ENCODERS:
+        if encoder == 'libx264':
+            break
+        if encoder in available and _encoder_works(encoder):
+            return encoder
+    return 'libx264'
+
+
+def _stat_or_raise(path: str) -> os.stat_result:
+    """Stat an input file, raising FileNotFoundError if it doesn't exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {path}")
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_info(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Probe a media file with ffprobe and extract its main properties.
+    
+    Results are cached; mtime_ns and size only serve as part of the cache key.
+    """
+    probe = ffmpeg.probe(path)
+    
+    # Find the first video and audio streams in one pass
+    video_stream = audio_stream = None
+    for stream in probe['streams']:
+        codec_type = stream.get('codec_type')
+        if codec_type == 'video' and video_stream is None:
+            video_stream = stream
+        elif codec_type == 'audio' and audio_stream is None:
+            audio_stream = stream
+        if video_stream is not None and audio_stream is not None:
+            break
+    
+    info = {
+        'duration': float(probe['format'].get('duration', 0)),
+        'size': int(probe['format'].get('size', 0)),
+        'format_name': probe['format'].get('format_name', 'unknown'),
+    }
+    
+    if video_stream:
+        info.update({
+            'width': int(video_stream.get('width', 0)),
+            'height': int(video_stream.get('height', 0)),
+            'fps': _parse_fraction(video_stream.get('r_frame_rate', '0/1')),
+            'video_codec': video_stream.get('codec_name', 'unknown'),
+        })
+    
+    if audio_stream:
+        info.update({
+            'audio_codec': audio_stream.get('codec_name', 'unknown'),
+            'sample_rate': int(audio_stream.get('sample_rate', 0)),
+            'channels': int(audio_stream.get('channels', 0)),
+        })
+    
+    return info
+
+
+@dataclass
+class FilterChain:
+    """
+    Editing operations for one input file, run as a single ffmpeg invocation.
+    
+    Operations are queued with the chainable methods and only run on flush
+    (or in VideoEditor.run_batch), so trimming, resizing, converting and
+    extracting audio decode the input once.
+    """
+    
+    input_file: str
+    output_file: Optional[str] = None
+    trim_range: Optional[Tuple[Optional[float], Optional[float]]] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    scale: Optional[str] = None
+    video_codec: Optional[str] = None
+    audio_codec: Optional[str] = None
+    extract_audio_to: Optional[str] = None
+    audio_format: str = 'mp3'
+    hw: Union[bool, str] = 'auto'
+    preset: Optional[str] = None
+    force_reencode: bool = False
+    
+    def trim(self, start: Optional[float] = None, end: Optional[float] = None) -> 'FilterChain':
+        """Keep only the given time range."""
+        self.trim_range = (start, end)
+        return self
+    
+    def resize(
+        self, width: Optional[int] = None, height: Optional[int] = None, scale: Optional[str] = None
+    ) -> 'FilterChain':
+        """Resize to the given dimensions or predefined scale."""
+        self.width, self.height, self.scale = width, height, scale
+        return self
+    
+    def convert(self, video_codec: Optional[str] = None, audio_codec: Optional[str] = None) -> 'FilterChain':
+        """Encode to the given codecs."""
+        self.video_codec, self.audio_codec = video_codec, audio_codec
+        return self
+    
+    def extract_audio(self, output_file: str, format: str = 'mp3') -> 'FilterChain':
+        """Also write the audio track to a separate file."""
+        self.extract_audio_to, self.audio_format = output_file, format
+        return self
+    
+    def pipeline_args(self) -> dict:
+        """Get the keyword arguments for VideoEditor.pipeline."""
+        return {
+            'input_file': self.input_file,
+            'output_file': self.output_file,
+            'trim': self.trim_range,
+            'width': self.width,
+            'height': self.height,
+            'scale': self.scale,
+            'video_codec': self.video_codec,
+            'audio_codec': self.audio_codec,
+            'extract_audio_to': self.extract_audio_to,
+            'audio_format': self.audio_format,
+            'hw': self.hw,
+            'preset': self.preset,
+            'force_reencode': self.force_reencode,
+        }
+    
+    def flush(self, editor: 'VideoEditor') -> str:
+        """
+        Run the queued operations.
+        
+        Args:
+            editor: Video editor to run them with
+            
+        Returns:
+            Path to the main output file (or the audio file if there is none)
+        """
+        return editor.pipeline(**self.pipeline_args())
+
+
+async def _run_ffmpeg(args: List[str], semaphore: asyncio.Semaphore) -> None:
+    """Run one ffmpeg command line once the semaphore lets it through."""
+    async with semaphore:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+    
+    if process.returncode != 0:
+        raise RuntimeError(f"FFmpeg error during processing: {stderr.decode(errors='replace')}")
+
+
 class VideoEditor:
     """Handle basic video editing operations with ffmpeg."""
     
@@ -18,13 +311,19 @@ class VideoEditor:
         self.console = Console()
         self._check_ffmpeg()
     
+    @property
+    def h264_encoder(self) -> str:
+        """The fastest usable H.264 encoder, detected on first use."""
+        return _select_h264_encoder()
+    
+    @property
+    def encoder_opts(self) -> dict:
+        """Output options for h264_encoder."""
+        return H264_ENCODERS[self.h264_encoder]
+    
     def _check_ffmpeg(self):
         """Check if ffmpeg is installed and accessible."""
-        try:
-            ffmpeg.probe('dummy')  # This will fail but tests if ffmpeg is available
-        except ffmpeg.Error:
-            pass  # Expected error for dummy input
-        except FileNotFoundError:
+        if shutil.which('ffmpeg') is None or shutil.which('ffprobe') is None:
             raise RuntimeError(
                 "FFmpeg not found. Please install FFmpeg and ensure it's in your PATH.\n"
                 "Installation instructions:\n"
@@ -33,76 +332,118 @@ class VideoEditor:
                 "- Ubuntu/Debian: sudo apt install ffmpeg"
             )
     
-    def get_video_info(self, input_file: str) -> dict:
+    def get_video_info(self, input_file: str, stat: Optional[os.stat_result] = None) -> dict:
         """
         Get video file information.
         
         Args:
             input_file: Path to input video file
+            stat: Result of os.stat on input_file, if the caller already has it
             
         Returns:
             Video metadata dictionary
         """
         try:
-            probe = ffmpeg.probe(input_file)
-            video_stream = next(
-                (stream for stream in probe['streams'] if stream['codec_type'] == 'video'), 
-                None
-            )
-            audio_stream = next(
-                (stream for stream in probe['streams'] if stream['codec_type'] == 'audio'), 
-                None
-            )
-            
-            info = {
-                'duration': float(probe['format'].get('duration', 0)),
-                'size': int(probe['format'].get('size', 0)),
-                'format_name': probe['format'].get('format_name', 'unknown'),
-            }
-            
-            if video_stream:
-                info.update({
-                    'width': int(video_stream.get('width', 0)),
-                    'height': int(video_stream.get('height', 0)),
-                    'fps': eval(video_stream.get('r_frame_rate', '0/1')),
-                    'video_codec': video_stream.get('codec_name', 'unknown'),
-                })
-            
-            if audio_stream:
-                info.update({
-                    'audio_codec': audio_stream.get('codec_name', 'unknown'),
-                    'sample_rate': int(audio_stream.get('sample_rate', 0)),
-                    'channels': int(audio_stream.get('channels', 0)),
-                })
-            
-            return info
+            # Keyed on mtime and size so a modified file is probed again
+            if stat is None:
+                stat = _stat_or_raise(input_file)
+            info = _probe_info(os.path.abspath(input_file), stat.st_mtime_ns, stat.st_size)
+            return dict(info)
             
         except Exception as e:
             raise RuntimeError(f"Failed to get video info: {e}")
     
+    def get_video_info_many(self, input_files: List[str], max_workers: int = 8) -> List[dict]:
+        """
+        Get information for several video files concurrently.
+        
+        Each probe is an ffprobe subprocess, so a thread pool overlaps them;
+        files probed before are answered from the cache.
+        
+        Args:
+            input_files: Paths to input video files
+            max_workers: Maximum number of concurrent probes
+            
+        Returns:
+            Video metadata dictionaries, in the same order as input_files
+        """
+        if not input_files:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(input_files))) as executor:
+            return list(executor.map(self.get_video_info, input_files))
+    
+    def _video_encoder(
+        self, hw: Union[bool, str], hw_frames: bool = True, preset: Optional[str] = None
+    ) -> Tuple[str, dict, dict]:
+        """
+        Resolve the hw argument into an H.264 encoder and its ffmpeg options.
+        
+        Args:
+            hw: 'auto' or True for the detected encoder, False for libx264,
+                or an encoder name
+            hw_frames: Whether the filters in between can work on frames
+                decoded straight into GPU memory
+            preset: Encoder preset overriding the default one (optional)
+            
+        Returns:
+            Tuple of (encoder, input options, output options)
+        """
+        if hw is False:
+            encoder = 'libx264'
+        elif hw is True or hw == 'auto':
+            encoder = self.h264_encoder
+        else:
+            encoder = hw
+        
+        input_options = {}
+        if encoder == 'h264_vaapi':
+            input_options['vaapi_device'] = VAAPI_DEVICE
+            if hw_frames:
+                input_options.update(hwaccel='vaapi', hwaccel_output_format='vaapi')
+        return encoder, input_options, _encoder_options(H264_ENCODERS.get(encoder, {}), preset)
+    
+    def _upload_frames(self, video, encoder: str):
+        """Upload frames to the GPU for encoders that need them there."""
+        if encoder == 'h264_vaapi':
+            # Frames that were decoded in hardware pass through untouched
+            return video.filter('format', 'nv12|vaapi').filter('hwupload')
+        return video
+    
     def trim_video(
         self, 
         input_file: str, 
         output_file: str, 
         start: Optional[float] = None,
         end: Optional[float] = None,
-        duration: Optional[float] = None
+        duration: Optional[float] = None,
+        precise: bool = False,
+        hw: Union[bool, str] = 'auto',
+        preset: Optional[str] = None
     ) -> str:
         """
         Trim video to specified time range.
         
+        By default the cut is done without re-encoding, which runs at disk
+        speed but snaps the start to the nearest preceding keyframe, so the
+        clip may begin slightly before the requested time. With precise the
+        video is re-encoded through the trim filters for a frame-accurate cut.
+        
         Args:
             input_file: Path to input video file
             output_file: Path to output video file
             start: Start time in seconds (optional)
             end: End time in seconds (optional)
             duration: Duration in seconds from start (optional)
+            precise: Re-encode for a frame-accurate cut instead of stream copying
+            hw: H.264 encoder to re-encode with ('auto' picks a hardware
+                encoder when one is available, False forces libx264)
+            preset: Encoder preset when re-encoding, e.g. 'veryfast' (optional)
             
         Returns:
             Path to output file
         """
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"Input file not found: {input_file}")
+        _stat_or_raise(input_file)
         
         # Validate time parameters
         if start is None and end is None and duration is None:
@@ -112,32 +453,41 @@ class VideoEditor:
             raise ValueError("Cannot specify both end time and duration")
         
         try:
-            input_stream = ffmpeg.input(input_file)
-            
-            # Build filter arguments
-            filter_args = {}
-            if start is not None:
-                filter_args['start'] = start
-            if end is not None:
-                filter_args['end'] = end
-            if duration is not None:
-                filter_args['duration'] = duration
-            
-            # Apply trim filter
-            if filter_args:
-                video = input_stream.video.filter('trim', **filter_args).filter('setpts', 'PTS-STARTPTS')
-                audio = input_stream.audio.filter('atrim', **filter_args).filter('asetpts', 'PTS-STARTPTS')
+            if not precise:
+                output = self._copy_trim_output(input_file, output_file, start, end, duration)
             else:
-                video = input_stream.video
-                audio = input_stream.audio
-            
-            # Output with re-encoding
-            output = ffmpeg.output(
-                video, audio, output_file,
-                vcodec='libx264',
-                acodec='aac',
-                **{'avoid_negative_ts': 'make_zero'}
-            )
+                # Seek on the demuxer (-ss before -i) instead of decoding and
+                # discarding every frame up to the start point
+                seek = 0.0
+                encoder, input_options, encoder_options = self._video_encoder(hw, preset=preset)
+                if start is not None and start > SEEK_MARGIN:
+                    seek = start - SEEK_MARGIN
+                    input_options['ss'] = seek
+                
+                input_stream = ffmpeg.input(input_file, **input_options)
+                
+                # Build filter arguments (timestamps are relative to the seek point)
+                filter_args = {}
+                if start is not None:
+                    filter_args['start'] = start - seek
+                if end is not None:
+                    filter_args['end'] = end - seek
+                if duration is not None:
+                    filter_args['duration'] = duration
+                
+                # Apply trim filter
+                video = self._build_video_chain(input_stream.video, trim=filter_args)
+                audio = self._build_audio_chain(input_stream.audio, trim=filter_args)
+                
+                # Output with re-encoding
+                output = ffmpeg.output(
+                    self._upload_frames(video, encoder), audio, output_file,
+                    vcodec=encoder,
+                    acodec='aac',
+                    **encoder_options,
+                    **_muxer_options(output_file),
+                    **{'avoid_negative_ts': 'make_zero'}
+                )
             
             # Run ffmpeg
             self.console.print(f"✂️  Trimming video: {os.path.basename(input_file)}")
@@ -157,7 +507,38 @@ class VideoEditor:
             stderr = e.stderr.decode() if e.stderr else "Unknown error"
             raise RuntimeError(f"FFmpeg error during trimming: {stderr}")
     
-    def remove_start(self, input_file: str, output_file: str, seconds: float) -> str:
+    def _copy_trim_output(
+        self,
+        input_file: str,
+        output_file: str,
+        start: Optional[float],
+        end: Optional[float],
+        duration: Optional[float]
+    ):
+        """Build a keyframe-seek + stream-copy trim (-ss before -i, -c copy)."""
+        input_options = {}
+        if start is not None:
+            input_options['ss'] = start
+        
+        # Timestamps restart at the seek point, so an end time becomes a duration
+        output_options = {}
+        if duration is not None:
+            output_options['t'] = duration
+        elif end is not None:
+            output_options['t'] = end - (start or 0)
+        
+        return ffmpeg.output(
+            ffmpeg.input(input_file, **input_options),
+            output_file,
+            c='copy',
+            **output_options,
+            **_muxer_options(output_file),
+            **{'avoid_negative_ts': 'make_zero'}
+        )
+    
+    def remove_start(
+        self, input_file: str, output_file: str, seconds: float, precise: bool = False
+    ) -> str:
         """
         Remove the first N seconds from a video.
         
@@ -165,13 +546,16 @@ class VideoEditor:
             input_file: Path to input video file
             output_file: Path to output video file
             seconds: Number of seconds to remove from start
+            precise: Re-encode for a frame-accurate cut instead of stream copying
             
         Returns:
             Path to output file
         """
-        return self.trim_video(input_file, output_file, start=seconds)
+        return self.trim_video(input_file, output_file, start=seconds, precise=precise)
     
-    def remove_end(self, input_file: str, output_file: str, seconds: float) -> str:
+    def remove_end(
+        self, input_file: str, output_file: str, seconds: float, precise: bool = False
+    ) -> str:
         """
         Remove the last N seconds from a video.
         
@@ -179,19 +563,20 @@ class VideoEditor:
             input_file: Path to input video file
             output_file: Path to output video file
             seconds: Number of seconds to remove from end
+            precise: Re-encode for a frame-accurate cut instead of stream copying
             
         Returns:
             Path to output file
         """
         # Get video duration first
-        info = self.get_video_info(input_file)
+        info = self.get_video_info(input_file, _stat_or_raise(input_file))
         duration = info['duration']
         end_time = duration - seconds
         
         if end_time <= 0:
             raise ValueError(f"Cannot remove {seconds}s from a {duration}s video")
         
-        return self.trim_video(input_file, output_file, end=end_time)
+        return self.trim_video(input_file, output_file, end=end_time, precise=precise)
     
     def convert_format(
         self, 
@@ -199,42 +584,83 @@ class VideoEditor:
         output_file: str, 
         video_codec: Optional[str] = None,
         audio_codec: Optional[str] = None,
-        crf: Optional[int] = None
+        crf: Optional[int] = None,
+        hw: Union[bool, str] = 'auto',
+        force_reencode: bool = False,
+        preset: Optional[str] = None
     ) -> str:
         """
         Convert video to different format/codec.
         
+        Streams already in the requested codec are copied instead of being
+        re-encoded (crf is ignored for a copied video stream).
+        
         Args:
             input_file: Path to input video file
             output_file: Path to output video file
             video_codec: Video codec (e.g., 'libx264', 'libx265')
             audio_codec: Audio codec (e.g., 'aac', 'mp3')
             crf: Constant Rate Factor for quality (lower = better quality)
+            hw: Encoder to use instead of libx264 ('auto' picks a hardware
+                encoder when one is available, False keeps libx264)
+            force_reencode: Re-encode even when the codecs already match
+            preset: Video encoder preset, e.g. 'veryfast' (optional)
             
         Returns:
             Path to output file
         """
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"Input file not found: {input_file}")
+        stat = _stat_or_raise(input_file)
+        
+        copy_video = copy_audio = False
+        if not force_reencode and (video_codec or audio_codec):
+            info = self.get_video_info(input_file, stat)
+            copy_video = bool(video_codec) and _codec_of(video_codec) == info.get('video_codec')
+            copy_audio = bool(audio_codec) and _codec_of(audio_codec) == info.get('audio_codec')
         
         try:
-            input_stream = ffmpeg.input(input_file)
+            input_options = {}
+            output_options = _muxer_options(output_file)
+            encoder = video_codec
+            if copy_video:
+                encoder = 'copy'
+                crf = None
+            elif video_codec == 'libx264':
+                encoder, input_options, encoder_options = self._video_encoder(hw, preset=preset)
+                output_options.update(encoder_options)
+            elif video_codec:
+                output_options.update(_encoder_options({}, preset))
+            
+            input_stream = ffmpeg.input(input_file, **input_options)
             
             # Build output options
-            output_options = {}
-            if video_codec:
-                output_options['vcodec'] = video_codec
+            if encoder:
+                output_options['vcodec'] = encoder
             if audio_codec:
-                output_options['acodec'] = audio_codec
+                output_options['acodec'] = 'copy' if copy_audio else audio_codec
             if crf is not None:
-                output_options['crf'] = crf
+                quality_option = _QUALITY_OPTIONS.get(encoder, 'crf')
+                if quality_option:
+                    output_options[quality_option] = crf
+                else:
+                    self.console.print(f"⚠️  [yellow]{encoder} has no CRF equivalent, ignoring crf={crf}[/yellow]")
             
-            output = ffmpeg.output(input_stream, output_file, **output_options)
+            if encoder == 'h264_vaapi':
+                # Audio is mapped optionally so inputs without an audio track still convert
+                output = ffmpeg.output(
+                    self._upload_frames(input_stream.video, encoder), input_stream['a?'],
+                    output_file, **output_options
+                )
+            else:
+                output = ffmpeg.output(input_stream, output_file, **output_options)
             
             self.console.print(f"🔄 Converting: {os.path.basename(input_file)}")
-            if video_codec:
-                self.console.print(f"   Video codec: {video_codec}")
-            if audio_codec:
+            if copy_video:
+                self.console.print(f"   Video codec: {video_codec} (stream-copy, no re-encode)")
+            elif encoder:
+                self.console.print(f"   Video codec: {encoder}")
+            if copy_audio:
+                self.console.print(f"   Audio codec: {audio_codec} (stream-copy, no re-encode)")
+            elif audio_codec:
                 self.console.print(f"   Audio codec: {audio_codec}")
             
             ffmpeg.run(output, overwrite_output=True, quiet=True)
@@ -250,6 +676,9 @@ class VideoEditor:
         """
         Extract audio from video file.
         
+        If the audio track is already in a codec the format can hold, it is
+        copied out as is instead of being re-encoded.
+        
         Args:
             input_file: Path to input video file
             output_file: Path to output audio file
@@ -258,21 +687,33 @@ class VideoEditor:
         Returns:
             Path to output file
         """
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"Input file not found: {input_file}")
+        stat = _stat_or_raise(input_file)
+        info = self.get_video_info(input_file, stat)
+        copy_audio = info.get('audio_codec') in _AUDIO_FORMAT_CODECS.get(format, ())
         
         try:
             input_stream = ffmpeg.input(input_file)
             
             # Extract audio only
-            output = ffmpeg.output(
-                input_stream.audio, 
-                output_file,
-                acodec='mp3' if format == 'mp3' else format,
-                audio_bitrate='192k'
-            )
+            if copy_audio:
+                output = ffmpeg.output(
+                    input_stream.audio,
+                    output_file,
+                    acodec='copy',
+                    **_muxer_options(output_file)
+                )
+            else:
+                output = ffmpeg.output(
+                    input_stream.audio, 
+                    output_file,
+                    acodec='mp3' if format == 'mp3' else format,
+                    audio_bitrate='192k',
+                    **_muxer_options(output_file)
+                )
             
             self.console.print(f"🎵 Extracting audio: {os.path.basename(input_file)}")
+            if copy_audio:
+                self.console.print(f"   Audio codec: {info['audio_codec']} (stream-copy, no re-encode)")
             
             ffmpeg.run(output, overwrite_output=True, quiet=True)
             
@@ -283,75 +724,480 @@ class VideoEditor:
             stderr = e.stderr.decode() if e.stderr else "Unknown error"
             raise RuntimeError(f"FFmpeg error during audio extraction: {stderr}")
     
+    def _scale_args(
+        self, width: Optional[int], height: Optional[int], scale: Optional[str]
+    ) -> Tuple[Union[int, str], ...]:
+        """Get the arguments for ffmpeg's scale filter."""
+        if scale:
+            scale_map = {
+                '720': 'hd720',
+                '1080': 'hd1080', 
+                'hd720': 'hd720',
+                'hd1080': 'hd1080',
+                '480': '854:480',
+                '360': '640:360',
+            }
+            return (scale_map.get(scale, scale),)
+        
+        # Use width/height
+        return (width if width else -1, height if height else -1)
+    
+    def _build_video_chain(
+        self, stream, trim: Optional[dict] = None, scale: Optional[Tuple[Union[int, str], ...]] = None
+    ):
+        """
+        Apply the trim and scale filters to a video stream.
+        
+        Args:
+            stream: Video stream to filter
+            trim: Arguments for the trim filter, relative to any input seek (optional)
+            scale: Arguments for the scale filter, as from _scale_args (optional)
+            
+        Returns:
+            Filtered video stream
+        """
+        if trim:
+            stream = stream.filter('trim', **trim).filter('setpts', 'PTS-STARTPTS')
+        if scale:
+            stream = stream.filter('scale', *scale)
+        return stream
+    
+    def _build_audio_chain(self, stream, trim: Optional[dict] = None):
+        """
+        Apply the trim filter to an audio stream.
+        
+        Args:
+            stream: Audio stream to filter
+            trim: Arguments for the atrim filter, relative to any input seek (optional)
+            
+        Returns:
+            Filtered audio stream
+        """
+        if trim:
+            stream = stream.filter('atrim', **trim).filter('asetpts', 'PTS-STARTPTS')
+        return stream
+    
+    def _gpu_scale_size(
+        self, width: Optional[int], height: Optional[int], scale: Optional[str]
+    ) -> Optional[Tuple[int, int]]:
+        """Get the target size for a GPU scale filter, or None if it can't take it."""
+        if scale:
+            size = self._scale_args(None, None, scale)[0]
+            size = {'hd720': '1280:720', 'hd1080': '1920:1080'}.get(size, size)
+            dimensions = size.replace('x', ':').split(':')
+            if len(dimensions) != 2 or not all(d.lstrip('-').isdigit() for d in dimensions):
+                return None
+            return int(dimensions[0]), int(dimensions[1])
+        
+        # Encoders need even dimensions, so keep the aspect ratio with -2
+        return (width or -2, height or -2)
+    
     def resize_video(
         self, 
         input_file: str, 
         output_file: str, 
         width: Optional[int] = None,
         height: Optional[int] = None,
-        scale: Optional[str] = None
+        scale: Optional[str] = None,
+        hw: Union[bool, str] = 'auto',
+        preset: Optional[str] = None
     ) -> str:
         """
         Resize video to specified dimensions.
         
+        With NVENC or VAAPI the video is decoded, scaled and encoded on the
+        GPU without copying frames back to system memory. If the GPU can't
+        handle the input, the resize is redone with the CPU scale filter.
+        
         Args:
             input_file: Path to input video file
             output_file: Path to output video file
             width: Target width in pixels
             height: Target height in pixels
             scale: Predefined scale (e.g., '720', '1080', 'hd720', 'hd1080')
+            hw: H.264 encoder to use ('auto' picks a hardware encoder when one
+                is available, False forces libx264)
+            preset: Encoder preset, e.g. 'veryfast' (optional)
             
         Returns:
             Path to output file
         """
-        if not os.path.exists(input_file):
-            raise FileNotFoundError(f"Input file not found: {input_file}")
+        _stat_or_raise(input_file)
         
         if not any([width, height, scale]):
             raise ValueError("Must specify width, height, or scale")
         
         try:
-            input_stream = ffmpeg.input(input_file)
+            encoder, input_options, encoder_options = self._video_encoder(hw, hw_frames=False, preset=preset)
+            encoder_options.update(_muxer_options(output_file))
+            gpu_size = self._gpu_scale_size(width, height, scale) if encoder in GPU_SCALERS else None
             
-            # Determine scale parameters
+            self.console.print(f"📐 Resizing video: {os.path.basename(input_file)}")
             if scale:
-                scale_map = {
-                    '720': 'hd720',
-                    '1080': 'hd1080', 
-                    'hd720': 'hd720',
-                    'hd1080': 'hd1080',
-                    '480': '854:480',
-                    '360': '640:360',
-                }
-                scale_param = scale_map.get(scale, scale)
-                video = input_stream.video.filter('scale', scale_param)
+                self.console.print(f"   Scale: {scale}")
             else:
-                # Use width/height
-                w = width if width else -1
-                h = height if height else -1
-                video = input_stream.video.filter('scale', w, h)
+                self.console.print(f"   Dimensions: {width or 'auto'}x{height or 'auto'}")
+            
+            if gpu_size:
+                scale_filter, gpu_input_options = GPU_SCALERS[encoder]
+                input_stream = ffmpeg.input(input_file, **gpu_input_options)
+                video = input_stream.video
+                if encoder == 'h264_vaapi':
+                    # Upload frames the hardware decoder couldn't produce itself
+                    video = self._upload_frames(video, encoder)
+                video = video.filter(scale_filter, *gpu_size)
+                
+                try:
+                    ffmpeg.run(
+                        ffmpeg.output(
+                            video, input_stream.audio,
+                            output_file,
+                            vcodec=encoder,
+                            acodec='copy',
+                            **encoder_options
+                        ),
+                        overwrite_output=True, quiet=True
+                    )
+                    self.console.print(f"✅ Resize completed: {os.path.basename(output_file)}")
+                    return output_file
+                except ffmpeg.Error:
+                    self.console.print("   GPU scaling failed, falling back to the CPU scale filter")
+            
+            # The scale filter runs on the CPU, so decode into system memory
+            input_stream = ffmpeg.input(input_file, **input_options)
+            
+            video = self._build_video_chain(
+                input_stream.video, scale=self._scale_args(width, height, scale)
+            )
             
             output = ffmpeg.output(
-                video, input_stream.audio, 
+                self._upload_frames(video, encoder), input_stream.audio, 
                 output_file,
-                vcodec='libx264',
-                acodec='copy'
+                vcodec=encoder,
+                acodec='copy',
+                **encoder_options
             )
             
-            self.console.print(f"📐 Resizing video: {os.path.basename(input_file)}")
+            ffmpeg.run(output, overwrite_output=True, quiet=True)
+            
+            self.console.print(f"✅ Resize completed: {os.path.basename(output_file)}")
+            return output_file
+            
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode() if e.stderr else "Unknown error"
+            raise RuntimeError(f"FFmpeg error during resize: {stderr}")
+    
+    def process(
+        self,
+        input_file: str,
+        output_file: str,
+        trim: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        scale: Optional[str] = None,
+        hw: Union[bool, str] = 'auto',
+        preset: Optional[str] = None
+    ) -> str:
+        """
+        Trim and resize a video with a single decode and encode.
+        
+        Running trim_video and then resize_video encodes the video twice,
+        through an intermediate file; here both filters go into one graph.
+        
+        Args:
+            input_file: Path to input video file
+            output_file: Path to output video file
+            trim: (start, end) time range in seconds to keep (optional)
+            width: Target width in pixels (optional)
+            height: Target height in pixels (optional)
+            scale: Predefined scale, as in resize_video (optional)
+            hw: H.264 encoder to use, as in trim_video
+            preset: Encoder preset, e.g. 'veryfast' (optional)
+            
+        Returns:
+            Path to output file
+        """
+        return self.pipeline(
+            input_file, output_file, trim=trim, width=width, height=height, scale=scale,
+            hw=hw, preset=preset
+        )
+    
+    def _pipeline_graph(
+        self,
+        input_file: str,
+        output_file: Optional[str],
+        trim: Optional[Tuple[Optional[float], Optional[float]]],
+        width: Optional[int],
+        height: Optional[int],
+        scale: Optional[str],
+        video_codec: Optional[str],
+        audio_codec: Optional[str],
+        extract_audio_to: Optional[str],
+        audio_format: str,
+        hw: Union[bool, str],
+        preset: Optional[str],
+        force_reencode: bool = False,
+        stat: Optional[os.stat_result] = None
+    ):
+        """
+        Build the ffmpeg graph for pipeline, with every output merged in.
+        
+        stat is the caller's stat of input_file, reused to look up the
+        cached probe instead of stat-ing the file again.
+        
+        Returns:
+            Tuple of (output node, video codec and audio codec of the main
+            output, 'copy' for streams that aren't re-encoded)
+        """
+        start, end = trim if trim else (None, None)
+        resizing = any([width, height, scale])
+        
+        # Streams already in the requested codec are copied instead of being
+        # re-encoded, unless a filter has to touch them
+        info = None
+        copy_audio = False
+        if output_file and not force_reencode and (video_codec or audio_codec):
+            info = self.get_video_info(input_file, stat)
+            if video_codec and not resizing and _codec_of(video_codec) == info.get('video_codec'):
+                video_codec = None
+            copy_audio = bool(audio_codec) and _codec_of(audio_codec) == info.get('audio_codec')
+        
+        reencode_video = resizing or video_codec is not None
+        
+        # An unfiltered audio track is mapped optionally (-map 0:a?), but
+        # filters and a separate audio output need to know there is one
+        has_audio = True
+        if extract_audio_to or (reencode_video and (start is not None or end is not None)):
+            info = info or self.get_video_info(input_file, stat)
+            has_audio = 'audio_codec' in info
+        
+        if extract_audio_to and not has_audio:
+            if not output_file:
+                raise ValueError(f"No audio stream to extract in {os.path.basename(input_file)}")
+            self.console.print("⚠️  [yellow]Input has no audio stream, skipping audio extraction[/yellow]")
+            extract_audio_to = None
+        
+        input_options = {}
+        output_options = {}
+        seek = 0.0
+        encoder = video_codec
+        
+        if reencode_video and video_codec in (None, 'libx264'):
+            encoder, input_options, output_options = self._video_encoder(
+                hw, hw_frames=not resizing, preset=preset
+            )
+        elif reencode_video:
+            output_options = _encoder_options({}, preset)
+        
+        if reencode_video:
+            # Input-seek close to the start and let the trim filter finish the cut
+            if start is not None and start > SEEK_MARGIN:
+                seek = start - SEEK_MARGIN
+                input_options['ss'] = seek
+        elif start is not None:
+            seek = start
+            input_options['ss'] = seek
+        
+        input_stream = ffmpeg.input(input_file, **input_options)
+        video = input_stream.video
+        audio = input_stream['a?']
+        audio_filtered = False
+        
+        if reencode_video:
+            filter_args = {}
+            if start is not None:
+                filter_args['start'] = start - seek
+            if end is not None:
+                filter_args['end'] = end - seek
+            video = self._build_video_chain(
+                video,
+                trim=filter_args,
+                scale=self._scale_args(width, height, scale) if resizing else None
+            )
+            audio_filtered = bool(filter_args) and has_audio
+            if audio_filtered:
+                audio = self._build_audio_chain(input_stream.audio, trim=filter_args)
+            video = self._upload_frames(video, encoder)
+            
+            output_options['vcodec'] = encoder
+            if audio_filtered:
+                output_options['acodec'] = audio_codec or 'aac'
+            else:
+                output_options['acodec'] = 'copy' if copy_audio else audio_codec or 'copy'
+        else:
+            # Stream copy, cut by duration since timestamps restart at the seek point
+            output_options['vcodec'] = 'copy'
+            output_options['acodec'] = 'copy' if copy_audio else audio_codec or 'copy'
+            if end is not None:
+                output_options['t'] = end - seek
+        
+        # A filtered audio stream has to be split to feed two outputs
+        if audio_filtered and output_file and extract_audio_to:
+            audio_split = audio.filter_multi_output('asplit')
+            audio, extracted_audio = audio_split[0], audio_split[1]
+        else:
+            extracted_audio = audio
+        
+        outputs = []
+        if output_file:
+            outputs.append(ffmpeg.output(
+                video, audio, output_file,
+                **output_options,
+                **_muxer_options(output_file),
+                **{'avoid_negative_ts': 'make_zero'}
+            ))
+        if extract_audio_to:
+            audio_options = {'t': output_options['t']} if 't' in output_options else {}
+            outputs.append(ffmpeg.output(
+                extracted_audio,
+                extract_audio_to,
+                acodec='mp3' if audio_format == 'mp3' else audio_format,
+                audio_bitrate='192k',
+                **audio_options,
+                **_muxer_options(extract_audio_to)
+            ))
+        
+        return ffmpeg.merge_outputs(*outputs), output_options['vcodec'], output_options['acodec']
+    
+    def pipeline(
+        self,
+        input_file: str,
+        output_file: Optional[str],
+        trim: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        scale: Optional[str] = None,
+        video_codec: Optional[str] = None,
+        audio_codec: Optional[str] = None,
+        extract_audio_to: Optional[str] = None,
+        audio_format: str = 'mp3',
+        hw: Union[bool, str] = 'auto',
+        preset: Optional[str] = None,
+        force_reencode: bool = False
+    ) -> str:
+        """
+        Trim, resize, convert and extract audio in a single ffmpeg run.
+        
+        The input is decoded once and every output is written directly, instead
+        of chaining one ffmpeg run per operation through intermediate files.
+        When nothing requires re-encoding the video (no resize, and no codec or
+        the one it already has), the trim is a keyframe-seek stream copy, like
+        trim_video without precise. Audio already in audio_codec is copied too,
+        unless it's trimmed.
+        
+        Args:
+            input_file: Path to input video file
+            output_file: Path to output video file (None to only extract audio)
+            trim: (start, end) time range in seconds to keep (optional)
+            width: Target width in pixels (optional)
+            height: Target height in pixels (optional)
+            scale: Predefined scale, as in resize_video (optional)
+            video_codec: Video codec (e.g., 'libx264', 'libx265') (optional)
+            audio_codec: Audio codec (e.g., 'aac', 'mp3') (optional)
+            extract_audio_to: Path to also write the audio track to (optional)
+            audio_format: Audio format for extract_audio_to (mp3, wav, aac, etc.)
+            hw: H.264 encoder to use when video_codec is libx264 or unset, as
+                in trim_video
+            preset: Video encoder preset, e.g. 'veryfast' (optional)
+            force_reencode: Re-encode even when the codecs already match
+            
+        Returns:
+            Path to the main output file (or the audio file if there is none)
+        """
+        stat = _stat_or_raise(input_file)
+        
+        if output_file is None and extract_audio_to is None:
+            raise ValueError("Must specify an output file or extract_audio_to")
+        
+        start, end = trim if trim else (None, None)
+        resizing = any([width, height, scale])
+        
+        try:
+            output, output_vcodec, output_acodec = self._pipeline_graph(
+                input_file, output_file, trim, width, height, scale,
+                video_codec, audio_codec, extract_audio_to, audio_format, hw, preset,
+                force_reencode, stat
+            )
+            
+            self.console.print(f"⚙️  Processing video: {os.path.basename(input_file)}")
+            if start is not None or end is not None:
+                end_label = f"{end}s" if end is not None else 'end'
+                self.console.print(f"   Trim: {start or 0}s - {end_label}")
             if scale:
                 self.console.print(f"   Scale: {scale}")
-            else:
+            elif resizing:
                 self.console.print(f"   Dimensions: {width or 'auto'}x{height or 'auto'}")
+            if output_file and output_vcodec != 'copy':
+                self.console.print(f"   Video codec: {output_vcodec}")
+            elif output_file and video_codec:
+                self.console.print(f"   Video codec: {video_codec} (stream-copy, no re-encode)")
+            if output_file and audio_codec:
+                if output_acodec == 'copy':
+                    self.console.print(f"   Audio codec: {audio_codec} (stream-copy, no re-encode)")
+                else:
+                    self.console.print(f"   Audio codec: {audio_codec}")
+            if extract_audio_to:
+                self.console.print(f"   Audio: {os.path.basename(extract_audio_to)}")
             
             ffmpeg.run(output, overwrite_output=True, quiet=True)
             
-            self.console.print(f"✅ Resize completed: {os.path.basename(output_file)}")
-            return output_file
+            result = output_file or extract_audio_to
+            self.console.print(f"✅ Processing completed: {os.path.basename(result)}")
+            return result
             
         except ffmpeg.Error as e:
             stderr = e.stderr.decode() if e.stderr else "Unknown error"
-            raise RuntimeError(f"FFmpeg error during resize: {stderr}")
+            raise RuntimeError(f"FFmpeg error during processing: {stderr}")
+    
+    def run_batch(self, chains: List[FilterChain], max_parallel: Optional[int] = None) -> List[str]:
+        """
+        Run the filter chains of several files concurrently.
+        
+        Each chain is a single ffmpeg process; at most max_parallel of them run
+        at once. The default is half the CPU cores for software encoding, or
+        the NVENC session limit when encoding on an NVIDIA GPU.
+        
+        Args:
+            chains: Filter chains to run, one per input file
+            max_parallel: Maximum number of concurrent ffmpeg processes (optional)
+            
+        Returns:
+            Paths to the main output files, in the order of chains
+        """
+        commands = []
+        for chain in chains:
+            stat = _stat_or_raise(chain.input_file)
+            if chain.output_file is None and chain.extract_audio_to is None:
+                raise ValueError("Must specify an output file or extract_audio_to")
+            
+            output, _, _ = self._pipeline_graph(**chain.pipeline_args(), stat=stat)
+            commands.append(ffmpeg.compile(output, overwrite_output=True))
+        
+        if max_parallel is None:
+            if self.h264_encoder == 'h264_nvenc':
+                max_parallel = NVENC_SESSIONS
+            else:
+                max_parallel = max(1, (os.cpu_count() or 2) // 2)
+        
+        async def run_all():
+            semaphore = asyncio.Semaphore(max_parallel)
+            return await asyncio.gather(
+                *(_run_ffmpeg(args, semaphore) for args in commands),
+                return_exceptions=True
+            )
+        
+        self.console.print(f"⚙️  Processing {len(chains)} videos ({max_parallel} at a time)")
+        results = asyncio.run(run_all())
+        
+        outputs = []
+        for chain, result in zip(chains, results):
+            output_file = chain.output_file or chain.extract_audio_to
+            if isinstance(result, Exception):
+                raise RuntimeError(f"Failed to process {os.path.basename(chain.input_file)}: {result}")
+            outputs.append(output_file)
+        
+        self.console.print(f"✅ Processing completed: {len(outputs)} videos")
+        return outputs
 
 
 def parse_time(time_str: str) -> float:
@@ -370,15 +1216,17 @@ def parse_time(time_str: str) -> float:
         Time in seconds
     """
     try:
-        parts = time_str.split(':')
-        if len(parts) == 1:
-            return float(parts[0])
-        elif len(parts) == 2:
-            return float(parts[0]) * 60 + float(parts[1])
-        elif len(parts) == 3:
-            return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-        else:
+        rest, sep, seconds = time_str.rpartition(':')
+        if not sep:
+            return float(seconds)
+        
+        hours, sep, minutes = rest.rpartition(':')
+        if not sep:
+            return float(minutes) * 60 + float(seconds)
+        
+        if ':' in hours:
             raise ValueError("Invalid time format")
+        return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
     except ValueError:
         raise ValueError(f"Invalid time format: {time_str}. Use seconds, MM:SS, or HH:MM:SS")
 
@@ -3,11 +3,23 @@ Utility functions for ytdownloader.
 """
 
 import os
-import re
+import threading
 from pathlib import Path
-from typing import Optional, Union
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Maps characters that are invalid in filenames on some platform to '_' and
+# drops C0/C1 control characters, for a single str.translate pass
+_SANITIZE_TABLE = {ord(c): '_' for c in '<>:"/\\|?*'}
+_SANITIZE_TABLE.update(dict.fromkeys(range(0x20)))
+_SANITIZE_TABLE.update(dict.fromkeys(range(0x7f, 0xa0)))
+
+# Extensions get_file_extension_from_url recognizes
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv'})
 
 
 def format_filesize(size_bytes: Union[int, str, None]) -> str:
@@ -28,16 +40,14 @@ def format_filesize(size_bytes: Union[int, str, None]) -> str:
     except (ValueError, TypeError):
         return 'Unknown'
     
-    if size == 0:
+    if size <= 0:
         return '0 B'
     
-    size_names = ['B', 'KB', 'MB', 'GB', 'TB']
-    i = 0
-    while size >= 1024 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
+    # Every unit is 2**10 times the previous one, so the bit length picks it
+    size_names = ('B', 'KB', 'MB', 'GB', 'TB')
+    i = min((size.bit_length() - 1) // 10, len(size_names) - 1)
     
-    return f"{size:.1f} {size_names[i]}"
+    return f"{size / (1 << (i * 10)):.1f} {size_names[i]}"
 
 
 def format_duration(seconds: Union[float, int, None]) -> str:
@@ -58,9 +68,8 @@ def format_duration(seconds: Union[float, int, None]) -> str:
     except (ValueError, TypeError):
         return 'Unknown'
     
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
     
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -79,14 +88,9 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    # Remove control characters
-    sanitized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', sanitized)
-    
-    # Trim whitespace and dots from ends
-    sanitized = sanitized.strip(' .')
+    # Replace invalid characters, remove control characters and trim
+    # whitespace and dots from ends
+    sanitized = filename.translate(_SANITIZE_TABLE).strip(' .')
     
     # Ensure it's not empty
     if not sanitized:
@@ -141,7 +145,7 @@ def generate_output_filename(
     return str(output_path)
 
 
-def display_video_info(info: dict, console: Optional[Console] = None) -> None:
+def display_video_info(info: dict, console: Optional["Console"] = None) -> None:
     """
     Display video information in a formatted table.
     
@@ -149,6 +153,10 @@ def display_video_info(info: dict, console: Optional[Console] = None) -> None:
         info: Video information dictionary
         console: Rich console instance (optional)
     """
+    # Imported here since only the interactive commands display tables
+    from rich.console import Console
+    from rich.table import Table
+    
     if console is None:
         console = Console()
     
@@ -194,14 +202,17 @@ def display_video_info(info: dict, console: Optional[Console] = None) -> None:
     console.print(table)
 
 
-def display_formats_table(formats: list, console: Optional[Console] = None) -> None:
+def display_formats_table(formats: Iterable[dict], console: Optional["Console"] = None) -> None:
     """
     Display available formats in a formatted table.
     
     Args:
-        formats: List of format dictionaries
+        formats: Iterable of format dictionaries
         console: Rich console instance (optional)
     """
+    from rich.console import Console
+    from rich.table import Table
+    
     if console is None:
         console = Console()
     
@@ -213,14 +224,17 @@ def display_formats_table(formats: list, console: Optional[Console] = None) -> N
     table.add_column("Video Codec", style="magenta")
     table.add_column("Audio Codec", style="red")
     
+    # Bind the lookups once instead of resolving them for every cell
+    add_row = table.add_row
     for fmt in formats:
-        table.add_row(
-            fmt.get('format_id', 'unknown'),
-            fmt.get('ext', 'unknown'),
-            fmt.get('resolution', 'unknown'),
-            format_filesize(fmt.get('filesize')),
-            fmt.get('vcodec', 'none'),
-            fmt.get('acodec', 'none')
+        get = fmt.get
+        add_row(
+            get('format_id', 'unknown'),
+            get('ext', 'unknown'),
+            get('resolution', 'unknown'),
+            format_filesize(get('filesize')),
+            get('vcodec', 'none'),
+            get('acodec', 'none')
         )
     
     console.print(table)
@@ -266,6 +280,38 @@ def ensure_directory(directory: str) -> None:
     Path(directory).mkdir(parents=True, exist_ok=True)
 
 
+def remove_file_async(file_path: str) -> threading.Thread:
+    """
+    Remove a file without blocking the caller.
+    
+    The file is first renamed to a hidden name so it disappears from the
+    directory right away, then unlinked on a background thread. The thread
+    isn't a daemon, so the interpreter still waits for it before exiting.
+    
+    Args:
+        file_path: Path to the file to remove
+        
+    Returns:
+        The thread performing the removal
+    """
+    path = Path(file_path)
+    target = path.with_name(f".{path.name}.deleting")
+    try:
+        os.replace(path, target)
+    except OSError:
+        target = path  # Rename not possible (e.g. file in use on Windows)
+    
+    def remove():
+        try:
+            os.remove(target)
+        except OSError:
+            pass
+    
+    thread = threading.Thread(target=remove, name=f"remove-{path.name}")
+    thread.start()
+    return thread
+
+
 def get_file_extension_from_url(url: str) -> str:
     """
     Extract file extension from URL or return default.
@@ -277,12 +323,12 @@ def get_file_extension_from_url(url: str) -> str:
         File extension (with dot)
     """
     try:
-        path = Path(url)
-        ext = path.suffix
-        if ext in ['.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv']:
+        # Only look at the path, so query strings and fragments don't count
+        ext = os.path.splitext(urlparse(url).path)[1].lower()
+        if ext in _VIDEO_EXTENSIONS:
             return ext
-    except Exception:
-        pass
+    except ValueError:
+        pass  # Malformed URL, e.g. an unbalanced IPv6 bracket
     
     return '.mp4'  # Default
 